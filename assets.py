@@ -212,13 +212,10 @@ class AssetManager:
         if "grass" not in self.original_textures:
             return
 
-        # Scale the texture first
-        scaled = pygame.transform.scale(
-            self.original_textures["grass"], (tile_size, tile_size)
-        )
-
-        # Create a copy to modify
-        fog_surf = scaled.copy()
+        # Whiten at the source size and scale afterwards. scale() only picks
+        # pixels, so this matches filtering the scaled tile, but the per-pixel
+        # loop no longer grows with the zoom level.
+        fog_surf = self.original_textures["grass"].copy()
 
         # Apply white filter
         fog_surf.lock()
@@ -251,7 +248,7 @@ class AssetManager:
                 )
 
         fog_surf.unlock()
-        self.fog_tile = fog_surf
+        self.fog_tile = pygame.transform.scale(fog_surf, (tile_size, tile_size))
 
     def get_character_sprite(self, char_type, color_key):
         """
@@ -34,6 +34,8 @@ class Capital:
         self.x = x
         self.y = y
         self.team = team
+        # Capitals never move, so the adjacent spawn ring is fixed
+        self._spawn_positions = self._compute_spawn_positions()
         self.spawned_characters = 0  # Total characters spawned from this capital
         self.spawned_this_turn = False  # Whether a character was spawned this turn
 
@@ -136,8 +138,12 @@ class Capital:
         Characters spawn adjacent to the capital.
 
         Returns:
-            list: List of (x, y) tuples for valid spawn positions.
+            tuple: (x, y) tuples for valid spawn positions.
         """
+        return self._spawn_positions
+
+    def _compute_spawn_positions(self):
+        """Builds the ring of 8 tiles adjacent to the capital."""
         positions = []
         # Check all 8 adjacent tiles
         for dx in range(-1, 2):
@@ -145,7 +151,7 @@ class Capital:
                 if dx == 0 and dy == 0:
                     continue  # Skip the capital's own position
                 positions.append((self.x + dx, self.y + dy))
-        return positions
+        return tuple(positions)
 
     def get_glow_tiles(self):
         """
@@ -125,6 +125,7 @@ class Character:
         self.y = y
         self.team = team
         self.char_type = char_type
+        self.display_name = char_type.capitalize()  # e.g. "Warrior"
 
         # Get stats from character type
         stats = CharacterType.get_stats(char_type)
@@ -276,10 +277,6 @@ class Character:
         """Returns True if this character can see through enemy fog of war."""
         return self.reveals_enemy_fog
 
-    def get_type_display_name(self):
-        """Returns a display-friendly name for the character type."""
-        return self.char_type.capitalize()
-
     def get_team_color(self):
         """Returns the team's RGB color for glow effects."""
         return self.team.color
@@ -1,4 +1,5 @@
 import pygame
+from seer import Seer
 
 
 class FogOfWar:
@@ -92,23 +93,35 @@ class FogOfWar:
             team.reveal_area(character.x, character.y, visibility)
 
             # King's special ability: reveal enemy fog of war
-            if (
-                hasattr(character, "can_see_enemy_fog")
-                and character.can_see_enemy_fog()
-                and not character.is_dead()
-            ):
-                if all_teams:
-                    for other_team in all_teams:
-                        if other_team != team:
-                            # Copy all of enemy's revealed tiles to this team
-                            team.revealed_tiles.update(other_team.revealed_tiles)
+            if character.can_see_enemy_fog() and all_teams:
+                for other_team in all_teams:
+                    if other_team is not team:
+                        # Copy all of enemy's revealed tiles to this team
+                        team.revealed_tiles.update(other_team.revealed_tiles)
 
         # Reveal around seers (they have larger visibility - 15x15)
-        if hasattr(team, "seers"):
-            for seer in team.seers:
-                from seer import Seer
+        for seer in team.seers:
+            team.reveal_area(seer.x, seer.y, Seer.VISIBILITY_RANGE)
 
-                team.reveal_area(seer.x, seer.y, Seer.VISIBILITY_RANGE)
+    def reveal_around_entity(self, team, entity):
+        """
+        Reveals the area around a single character or seer after it moves.
+
+        Revealed tiles are never hidden again, so this adds the same tiles a
+        full update_team_visibility call would, without walking the rest of
+        the team.
+
+        Args:
+            team: The Team the entity belongs to.
+            entity: The Character or Seer that moved.
+        """
+        if isinstance(entity, Seer):
+            visibility = Seer.VISIBILITY_RANGE
+        else:
+            visibility = getattr(
+                entity, "visibility_range", self.DEFAULT_CHARACTER_VISIBILITY_RADIUS
+            )
+        team.reveal_area(entity.x, entity.y, visibility)
 
     def is_visible_to_team(self, tile_x, tile_y, team):
         """
@@ -140,12 +140,12 @@ class GameState:
         Args:
             team: The Team object to generate income for.
         """
-        if hasattr(team, "mines") and team.mines:
+        if team.mines:
             income = team.generate_mine_income()
             if income > 0:
                 print(f"{team.name} earned {income} gold from mines")
 
-        if hasattr(team, "capitals") and team.capitals:
+        if team.capitals:
             cap_income = 0
             for capital in team.capitals:
                 cap_income += capital.generate_income()
@@ -163,17 +163,10 @@ class GameState:
         for capital in team.capitals:
             capital.reset_turn()
 
-        # Reset all seers
-        if hasattr(team, "seers"):
-            team.reset_seers_for_turn()
-
-        # Reset all hospitals
-        if hasattr(team, "hospitals"):
-            team.reset_hospitals_for_turn()
-
-        # Reset all mines
-        if hasattr(team, "mines"):
-            team.reset_mines_for_turn()
+        # Reset all seers, hospitals and mines
+        team.reset_seers_for_turn()
+        team.reset_hospitals_for_turn()
+        team.reset_mines_for_turn()
 
     def select_character(self, character):
         """
@@ -213,6 +213,10 @@ class MainMenu:
         # Timer display area (to the left of menu button)
         self.timer_rect = pygame.Rect(screen_width - 170, 10, 110, 40)
 
+        # Rendered timer text, reused until the displayed seconds change
+        self.timer_text_key = None
+        self.timer_text_surfs = None
+
         # Main menu panel (centered)
         self.menu_width = 500
         self.menu_height = 550
@@ -548,21 +552,29 @@ class MainMenu:
         x = self.timer_rect.x + 8
         y = self.timer_rect.y + 4
 
-        # Format times
-        turn_mins = int(turn_time) // 60
-        turn_secs = int(turn_time) % 60
-        total_mins = int(total_time) // 60
-        total_secs = int(total_time) % 60
+        # The text only changes once a second, so re-render it only then
+        timer_key = (int(turn_time), int(total_time))
+        if timer_key != self.timer_text_key:
+            # Format times
+            turn_mins = timer_key[0] // 60
+            turn_secs = timer_key[0] % 60
+            total_mins = timer_key[1] // 60
+            total_secs = timer_key[1] % 60
+
+            turn_text = f"Turn: {turn_mins}:{turn_secs:02d}"
+            total_text = f"Game: {total_mins}:{total_secs:02d}"
+            self.timer_text_surfs = (
+                self.small_font.render(turn_text, True, GOLD_ACCENT),
+                self.small_font.render(total_text, True, BONE_WHITE),
+            )
+            self.timer_text_key = timer_key
+        turn_surf, total_surf = self.timer_text_surfs
 
         # Turn time (top)
-        turn_text = f"Turn: {turn_mins}:{turn_secs:02d}"
-        turn_surf = self.small_font.render(turn_text, True, GOLD_ACCENT)
         surface.blit(turn_surf, (x, y))
 
         # Total time (bottom)
         y += 18
-        total_text = f"Game: {total_mins}:{total_secs:02d}"
-        total_surf = self.small_font.render(total_text, True, BONE_WHITE)
         surface.blit(total_surf, (x, y))
 
     def _draw_menu_button(self, surface):
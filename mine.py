@@ -98,42 +98,6 @@ class Mine:
         self.team.add_money(income)
         return income
 
-    @staticmethod
-    def is_valid_position(x, y, world_map, all_entities):
-        """
-        Checks if a position is valid for placing a mine.
-        Must be on granite and not occupied.
-
-        Args:
-            x (int): The x-coordinate to check.
-            y (int): The y-coordinate to check.
-            world_map: The 2D array of tile types.
-            all_entities: Dict with lists of entities to check for occupation.
-                         Expected keys: 'characters', 'capitals', 'hospitals', 'mines', 'seers'
-
-        Returns:
-            bool: True if the position is valid for a mine.
-        """
-        # Check if tile is granite
-        try:
-            tile_type = world_map[y][x]
-            if tile_type != Mine.VALID_TERRAIN:
-                return False
-        except (IndexError, TypeError):
-            return False
-
-        # Check if position is occupied by any entity
-        for entity_type, entities in all_entities.items():
-            for entity in entities:
-                if hasattr(entity, "x") and hasattr(entity, "y"):
-                    if entity.x == x and entity.y == y:
-                        # For characters, skip dead ones
-                        if hasattr(entity, "is_dead") and entity.is_dead():
-                            continue
-                        return False
-
-        return True
-
     def draw_placeholder(self, surface, screen_x, screen_y, tile_size, font=None):
         """
         Draws a placeholder 'M' for the mine.
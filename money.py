@@ -115,14 +115,13 @@ class Money:
         Returns:
             pygame.Surface: The processed chicken sprite.
         """
-        # Scale the sprite
-        scaled = pygame.transform.scale(original_sprite, (tile_size, tile_size))
-
         if not inverted:
-            return scaled
+            return pygame.transform.scale(original_sprite, (tile_size, tile_size))
 
-        # Create inverted (black) chicken
-        inverted_surf = scaled.copy()
+        # Create inverted (black) chicken. The recolor is done at the source
+        # size and scaled afterwards: scale() only picks pixels, so the result
+        # is the same, but zooming in doesn't grow the per-pixel loop.
+        inverted_surf = original_sprite.copy()
         inverted_surf.lock()
 
         width, height = inverted_surf.get_size()
@@ -152,7 +151,7 @@ class Money:
                 inverted_surf.set_at((x, y), (new_r, new_g, new_b, color.a))
 
         inverted_surf.unlock()
-        return inverted_surf
+        return pygame.transform.scale(inverted_surf, (tile_size, tile_size))
 
     @staticmethod
     def create_gold_sprite(base_texture, tile_size, shiny=False):
@@ -167,11 +166,8 @@ class Money:
         Returns:
             pygame.Surface: A gold-tinted sprite.
         """
-        # Scale the texture first
-        scaled = pygame.transform.scale(base_texture, (tile_size, tile_size))
-
-        # Create a copy to modify
-        gold_surf = scaled.copy()
+        # Tint at the source size and scale afterwards, like the black chicken
+        gold_surf = base_texture.copy()
 
         # Apply gold tint
         gold_surf.lock()
@@ -203,12 +199,6 @@ class Money:
                     new_r = int(gold_r * (0.5 + inv_luminance * 0.5))
                     new_g = int(gold_g * (0.5 + inv_luminance * 0.5))
                     new_b = int(gold_b * (0.3 + inv_luminance * 0.5))
-
-                    # Add sparkle effect
-                    if (x + y) % 4 == 0:
-                        new_r = min(255, new_r + 50)
-                        new_g = min(255, new_g + 50)
-                        new_b = min(255, new_b + 40)
                 else:
                     # Regular gold effect
                     contrast_factor = 1.5
@@ -236,6 +226,25 @@ class Money:
                 )
 
         gold_surf.unlock()
+        gold_surf = pygame.transform.scale(gold_surf, (tile_size, tile_size))
+
+        if shiny:
+            # Add sparkle effect on a diagonal pattern of the final pixels
+            gold_surf.lock()
+            for y in range(tile_size):
+                for x in range(-y % 4, tile_size, 4):
+                    color = gold_surf.get_at((x, y))
+                    gold_surf.set_at(
+                        (x, y),
+                        (
+                            min(255, color.r + 50),
+                            min(255, color.g + 50),
+                            min(255, color.b + 40),
+                            color.a,
+                        ),
+                    )
+            gold_surf.unlock()
+
         return gold_surf
 
     @staticmethod
@@ -283,7 +292,7 @@ class Money:
             final_alpha = int(max(0, min(220, alpha)))
             pygame.draw.circle(surf, (*glow_color, final_alpha), (radius, radius), i)
 
-        return surf
+        return surf.convert_alpha()
 
     @staticmethod
     def generate_money_positions(world_map, map_width, map_height, spawn_ratio=None):
@@ -1,10 +1,13 @@
 import math
+from collections import namedtuple
 
 import pygame
+from money import Money, MoneyType
 
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
+VOID_COLOR = (20, 18, 15)  # Dark brown-black shown outside the map bounds
 
 # Hover and attack colors
 HOVER_GLOW_COLOR = (255, 255, 255)
@@ -13,6 +16,29 @@ ATTACK_HOVER_GLOW_COLOR = (255, 100, 0)
 # Money glow color
 MONEY_GLOW_COLOR = (255, 215, 0)
 
+# Pulse lookup table size (one full sine cycle, must be a power of two)
+PULSE_LUT_SIZE = 64
+
+# Pulse speeds for each animated effect (radians per animation tick)
+PULSE_SPEEDS = {
+    "capital": 0.08,
+    "character": 0.1,
+    "money": 0.15,
+    "seer": 0.15,
+    "hover": 0.2,
+    "rare": 0.25,
+}
+
+# Pulse values (0.0 - 1.0) for a single frame, one field per animated effect
+FramePulses = namedtuple("FramePulses", PULSE_SPEEDS.keys())
+
+# Number of pre-baked alpha levels per glow surface
+GLOW_ALPHA_STEPS = 16
+
+# Tiles beyond the screen edge an entity may sit and still have its glow
+# or health bar reach into view (name labels are measured separately)
+CULL_MARGIN_TILES = 3
+
 
 class MapRenderer:
     """Handles rendering of the game world, characters, capitals, and effects."""
@@ -24,6 +50,12 @@ class MapRenderer:
 
         # Glow surfaces - now cached by color
         self.glow_cache = {}  # {(r, g, b, size): surface}
+        # Alpha-faded copies of glow surfaces, used instead of set_alpha
+        self.glow_alpha_variants = {}  # {glow surface: [surface per alpha step]}
+
+        # Sprites scaled to the current tile size
+        self.scaled_sprite_cache = {}  # {original sprite: scaled surface}
+        self.scaled_sprite_size = 0
         self.hover_glow_surf = None
         self.attack_hover_glow_surf = None
         # Glow surfaces for pickups
@@ -37,6 +69,8 @@ class MapRenderer:
 
         # Name label font
         self.name_font = None
+        # Name labels with their shadow already composed in
+        self.name_label_cache = {}  # {(name, color): surface}
 
         # Pickup sprites
         self.chicken_sprite = None
@@ -44,18 +78,41 @@ class MapRenderer:
         self.gold_sprite = None
         self.shiny_gold_sprite = None
 
-        # Fog tile
+        # Fog tile, and a screen-sized surface tiled with it
         self.fog_tile = None
+        self.fog_strip = None
+
+        # Last drawn map (void, fog and revealed terrain), reused while the
+        # view and the revealed tiles stay the same
+        self.map_layer = None
+        self.map_layer_key = None
+
+        # Pre-rendered empty health bar (shadow, background and border)
+        self.health_bar_bg = None
+        # Full-width health fills (highlight row over fill row)
+        self.health_fill_cache = {}  # {fill color: surface}
 
         # Current tile size for caching
         self.current_tile_size = 0
 
+        # Pulse lookup table - one sine cycle quantized to PULSE_LUT_SIZE phases
+        self.pulse_lut = [
+            (math.sin(2 * math.pi * i / PULSE_LUT_SIZE) + 1) / 2
+            for i in range(PULSE_LUT_SIZE)
+        ]
+        # LUT phases advanced per animation tick for each effect
+        self.pulse_steps = tuple(
+            speed * PULSE_LUT_SIZE / (2 * math.pi) for speed in PULSE_SPEEDS.values()
+        )
+
     def create_glow_surfaces(self, tile_size):
         """Create gradient glow surfaces for various effects."""
         self.current_tile_size = tile_size
 
         # Clear glow cache when tile size changes
         self.glow_cache = {}
+        self.glow_alpha_variants = {}
+        self.map_layer_key = None  # Terrain textures are rescaled too
 
         # Hover glows
         self.hover_glow_surf = self._create_gradient_circle(
@@ -70,6 +127,10 @@ class MapRenderer:
             int(tile_size * 0.8), MONEY_GLOW_COLOR
         )
 
+        # Empty health bar
+        self.health_bar_bg = self._create_health_bar_background(tile_size)
+        self.health_fill_cache = {}
+
         # Capital font
         try:
             self.capital_font = pygame.font.SysFont("Georgia", tile_size, bold=True)
@@ -83,6 +144,7 @@ class MapRenderer:
             )
         except pygame.error:
             self.name_font = pygame.font.Font(None, max(12, tile_size // 3))
+        self.name_label_cache = {}
 
     def _get_glow_surface(self, color, size_multiplier=1.2):
         """Gets or creates a glow surface for the given color."""
@@ -94,6 +156,47 @@ class MapRenderer:
 
         return self.glow_cache[cache_key]
 
+    def _get_glow_variant(self, glow_surf, alpha):
+        """
+        Gets or creates a copy of a glow surface faded to the given alpha,
+        quantized to GLOW_ALPHA_STEPS levels. Returns None for a missing glow.
+        """
+        if glow_surf is None:
+            return None
+
+        step = (alpha * (GLOW_ALPHA_STEPS - 1) + 127) // 255
+
+        variants = self.glow_alpha_variants.get(glow_surf)
+        if variants is None:
+            variants = [None] * GLOW_ALPHA_STEPS
+            self.glow_alpha_variants[glow_surf] = variants
+
+        variant = variants[step]
+        if variant is None:
+            # Bake the fade into the per-pixel alpha
+            level = step * 255 // (GLOW_ALPHA_STEPS - 1)
+            variant = glow_surf.copy()
+            variant.fill((255, 255, 255, level), special_flags=pygame.BLEND_RGBA_MULT)
+            variants[step] = variant
+
+        return variant
+
+    def _get_scaled_sprite(self, sprite, tile_size):
+        """Gets or creates a copy of a sprite scaled to the tile size."""
+        if tile_size != self.scaled_sprite_size:
+            # Zoom changed - every cached sprite is the wrong size
+            self.scaled_sprite_cache = {}
+            self.scaled_sprite_size = tile_size
+
+        scaled = self.scaled_sprite_cache.get(sprite)
+        if scaled is None:
+            scaled = pygame.transform.scale(
+                sprite, (tile_size, tile_size)
+            ).convert_alpha()
+            self.scaled_sprite_cache[sprite] = scaled
+
+        return scaled
+
     def _create_gradient_circle(self, radius, color):
         """Creates a circular surface with a soft, gradient glow."""
         if radius <= 0:
@@ -106,7 +209,62 @@ class MapRenderer:
             final_alpha = int(max(0, min(255, alpha * 1.2)))
             pygame.draw.circle(surf, (*color, final_alpha), (radius, radius), i)
 
-        return surf
+        return surf.convert_alpha()
+
+    def _create_health_bar_background(self, tile_size):
+        """Pre-renders the static parts of a health bar (shadow, background, border)."""
+        bar_width = tile_size + 4  # Slightly wider than tile
+        bar_height = 6  # Good visibility
+
+        surf = pygame.Surface((bar_width + 1, bar_height + 1), pygame.SRCALPHA)
+        bg_rect = (0, 0, bar_width, bar_height)
+
+        # Shadow/outline for visibility
+        pygame.draw.rect(
+            surf, (0, 0, 0), (1, 1, bar_width, bar_height), border_radius=2
+        )
+        # Background
+        pygame.draw.rect(surf, (30, 25, 20), bg_rect, border_radius=2)
+        # Border
+        pygame.draw.rect(surf, (100, 90, 70), bg_rect, 2, border_radius=2)
+
+        return surf.convert_alpha()
+
+    def _get_health_fill(self, fill_color):
+        """Returns a full-width health fill in a color, with its highlight row."""
+        fill_surf = self.health_fill_cache.get(fill_color)
+        if fill_surf is None:
+            # Inner width of the bar, inside the 2px border
+            fill_surf = pygame.Surface((self.current_tile_size, 2)).convert()
+            # Highlight on the top row for 3D effect
+            fill_surf.fill(
+                (
+                    min(255, fill_color[0] + 40),
+                    min(255, fill_color[1] + 40),
+                    min(255, fill_color[2] + 40),
+                ),
+                (0, 0, self.current_tile_size, 1),
+            )
+            fill_surf.fill(fill_color, (0, 1, self.current_tile_size, 1))
+            self.health_fill_cache[fill_color] = fill_surf
+        return fill_surf
+
+    def rebind_sprites(self, asset_manager, tile_size):
+        """
+        Rebuilds the glow surfaces and picks up the pickup sprites and fog
+        tile from the asset manager after its textures were rescaled.
+
+        Args:
+            asset_manager: The AssetManager holding textures at tile_size.
+            tile_size (int): The tile size the textures were scaled to.
+        """
+        self.create_glow_surfaces(tile_size)
+        self.set_chicken_sprite(asset_manager.get_chicken_sprite(False))
+        self.set_black_chicken_sprite(asset_manager.get_chicken_sprite(True))
+        self.set_gold_sprite(asset_manager.get_gold_sprite(False))
+        self.set_shiny_gold_sprite(asset_manager.get_gold_sprite(True))
+        self.set_pickup_glows(tile_size)
+        self.set_fog_tile(asset_manager.get_fog_tile())
 
     def set_chicken_sprite(self, sprite):
         """Sets the chicken sprite for rendering."""
@@ -126,7 +284,14 @@ class MapRenderer:
 
     def set_pickup_glows(self, tile_size):
         """Creates glow surfaces for all pickup types."""
-        from money import Money
+        # Drop faded copies of the pickup glows being replaced
+        for glow_surf in (
+            self.chicken_glow_surf,
+            self.black_chicken_glow_surf,
+            self.gold_glow_surf,
+            self.shiny_gold_glow_surf,
+        ):
+            self.glow_alpha_variants.pop(glow_surf, None)
 
         self.chicken_glow_surf = Money.create_glow_surface(
             tile_size, is_rare=False, is_chicken=True
@@ -143,13 +308,44 @@ class MapRenderer:
 
     def set_fog_tile(self, fog_tile):
         """Sets the fog of war tile for rendering."""
-        self.fog_tile = fog_tile
+        # Match the display format so the fog strip is built with plain copies
+        self.fog_tile = fog_tile.convert() if fog_tile else None
+        self.fog_strip = None  # Rebuilt from the new tile on next draw
+        self.map_layer_key = None
+
+    def _get_fog_strip(self):
+        """
+        Returns a surface covering the screen plus one tile, tiled with the
+        fog tile. Built on first use after the fog tile or screen changes.
+        """
+        if self.fog_strip is None and self.fog_tile:
+            tile_w, tile_h = self.fog_tile.get_size()
+            strip_w = self.screen_width + tile_w
+            strip_h = self.screen_height + tile_h
+
+            self.fog_strip = pygame.Surface((strip_w, strip_h)).convert()
+            for y in range(0, strip_h, tile_h):
+                for x in range(0, strip_w, tile_w):
+                    self.fog_strip.blit(self.fog_tile, (x, y))
+
+        return self.fog_strip
+
+    def _pulses_for_frame(self, animation_timer):
+        """Looks up the pulse value of every animated effect for this frame."""
+        lut = self.pulse_lut
+        mask = PULSE_LUT_SIZE - 1
+        return FramePulses(
+            *(lut[int(animation_timer * step) & mask] for step in self.pulse_steps)
+        )
 
     def update_screen(self, screen):
         """Updates the screen reference and dimensions."""
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
+        self.fog_strip = None  # Size depends on the screen
+        self.map_layer = None
+        self.scaled_sprite_cache = {}  # Converted to the old display format
 
     def draw(
         self,
@@ -166,40 +362,48 @@ class MapRenderer:
         current_team,
     ):
         """Draws all game elements to the screen."""
-        self.screen.fill(BLACK)
+        # Look up all effect pulses once for this frame
+        pulses = self._pulses_for_frame(animation_timer)
+
+        # Entities whose tile corner falls outside this area are skipped
+        cull_rect = self._get_cull_rect(camera, teams)
+        tile_size = camera.tile_size
 
         # Draw map with fog of war
         self._draw_map(world, camera, textures, current_team, fog_of_war)
 
         # Draw money pickups (only visible ones)
-        self._draw_money(money_pickups, camera, current_team, animation_timer)
-
-        # Draw capital glow effects
-        self._draw_capital_glows(teams, camera, current_team, animation_timer)
+        self._draw_money(money_pickups, camera, current_team, pulses, cull_rect)
 
-        # Draw capitals
-        self._draw_capitals(teams, camera, current_team)
+        # Draw capital glow effects, then the capitals found on screen
+        visible_capitals = self._draw_capital_glows(
+            teams, camera, current_team, pulses, cull_rect
+        )
+        self._draw_capitals(visible_capitals, tile_size)
 
         # Draw hospitals
-        self._draw_hospitals(teams, camera, current_team)
+        self._draw_hospitals(teams, camera, current_team, cull_rect)
 
         # Draw mines
-        self._draw_mines(teams, camera, current_team)
+        self._draw_mines(teams, camera, current_team, cull_rect)
 
         # Draw seer effects and seers
-        self._draw_seer_effects(teams, camera, animation_timer, current_team)
-        self._draw_seers(teams, camera, current_team)
+        visible_seers = self._draw_seer_effects(
+            teams, camera, pulses, current_team, cull_rect
+        )
+        self._draw_seers(visible_seers, tile_size)
 
         # Draw character effects and characters
-        self._draw_character_effects(
+        visible_characters = self._draw_character_effects(
             teams,
             camera,
             game_state,
             hovered_tile,
-            animation_timer,
+            pulses,
             current_team,
+            cull_rect,
         )
-        self._draw_characters(teams, camera, current_team)
+        self._draw_characters(visible_characters, tile_size)
 
         # UI is drawn last, on top of everything
         ui_manager.draw(self.screen, game_state, teams)
@@ -212,140 +416,218 @@ class MapRenderer:
         screen_w = self.screen_width
         screen_h = self.screen_height
         tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
+
+        # Tiles are only ever added to the revealed set, so its size tells
+        # whether the fog has changed since the layer was drawn
+        layer_key = (world, current_team, tile_size, offset_x, offset_y, len(revealed))
+        if self.map_layer is not None and layer_key == self.map_layer_key:
+            self.screen.blit(self.map_layer, (0, 0))
+            return
 
-        # Calculate visible tile range including areas outside map for background fill
-        # We need to draw tiles that might be partially visible
-        vis_start_col = int(camera.offset_x // tile_size) - 1
-        vis_end_col = int((camera.offset_x + screen_w) // tile_size) + 2
-        vis_start_row = int(camera.offset_y // tile_size) - 1
-        vis_end_row = int((camera.offset_y + screen_h) // tile_size) + 2
+        if self.map_layer is None:
+            self.map_layer = pygame.Surface((screen_w, screen_h)).convert()
+        layer = self.map_layer
+
+        # Void everywhere; the map is drawn over its own area
+        layer.fill(VOID_COLOR)
+
+        # Calculate the map tiles that are at least partially on screen
+        vis_start_col = max(0, int(offset_x // tile_size))
+        vis_end_col = min(world.width, int((offset_x + screen_w - 1) // tile_size) + 1)
+        vis_start_row = max(0, int(offset_y // tile_size))
+        vis_end_row = min(world.height, int((offset_y + screen_h - 1) // tile_size) + 1)
+
+        # Cover the whole map with fog in one blit; revealed tiles are drawn on top
+        map_rect = pygame.Rect(
+            -offset_x,
+            -offset_y,
+            world.width * tile_size,
+            world.height * tile_size,
+        ).clip(layer.get_rect())
+        fog_strip = self._get_fog_strip()
+        if fog_strip:
+            # Align the fog pattern with the tile grid
+            strip_x = -(offset_x % tile_size)
+            strip_y = -(offset_y % tile_size)
+            layer.blit(
+                fog_strip,
+                map_rect,
+                map_rect.move(-strip_x, -strip_y),
+            )
+        else:
+            # Fallback: dark gray fog
+            layer.fill((40, 40, 45), map_rect)
+
+        world_map = world.world_map
+        textures_get = textures.get
+
+        # Revealed terrain is collected and blitted in one batch
+        terrain_blits = []
 
-        # Draw all visible positions (including outside map bounds)
+        # Screen x of each visible column, worked out once for all rows
+        columns = [
+            (x, x * tile_size - offset_x) for x in range(vis_start_col, vis_end_col)
+        ]
+
+        # Draw normal tiles over the fog where revealed
         for y in range(vis_start_row, vis_end_row):
-            for x in range(vis_start_col, vis_end_col):
-                screen_x = x * tile_size - camera.offset_x
-                screen_y = y * tile_size - camera.offset_y
+            row = world_map[y]
+            screen_y = y * tile_size - offset_y
+            for x, screen_x in columns:
+                if (x, y) in revealed:
+                    # One dict probe per tile; unknown tile types stay fogged
+                    texture = textures_get(row[x])
+                    if texture is not None:
+                        terrain_blits.append((texture, (screen_x, screen_y)))
 
-                # Skip if completely off screen
-                if screen_x + tile_size < 0 or screen_x > screen_w:
-                    continue
-                if screen_y + tile_size < 0 or screen_y > screen_h:
-                    continue
+        layer.fblits(terrain_blits)
 
-                # Check if this position is within the map bounds
-                if 0 <= x < world.width and 0 <= y < world.height:
-                    # Check if tile is revealed
-                    if current_team.is_tile_revealed(x, y):
-                        # Draw normal tile
-                        tile_type = world.world_map[y][x]
-                        if tile_type in textures:
-                            self.screen.blit(textures[tile_type], (screen_x, screen_y))
-                    else:
-                        # Draw fog tile
-                        if self.fog_tile:
-                            self.screen.blit(self.fog_tile, (screen_x, screen_y))
-                        else:
-                            # Fallback: draw dark gray fog
-                            pygame.draw.rect(
-                                self.screen,
-                                (40, 40, 45),
-                                (screen_x, screen_y, tile_size, tile_size),
-                            )
-                else:
-                    # Outside map bounds - draw dark background/void
-                    pygame.draw.rect(
-                        self.screen,
-                        (20, 18, 15),  # Dark brown-black void color
-                        (screen_x, screen_y, tile_size, tile_size),
-                    )
+        self.screen.blit(layer, (0, 0))
+        self.map_layer_key = layer_key
 
-    def _draw_money(self, money_pickups, camera, current_team, animation_timer):
+    def _draw_money(self, money_pickups, camera, current_team, pulses, cull_rect):
         """Draws money pickups (chickens and gold) with glow effect."""
-        pulse = (math.sin(animation_timer * 0.15) + 1) / 2
-        # Faster pulse for rare variants
-        rare_pulse = (math.sin(animation_timer * 0.25) + 1) / 2
-
-        from money import MoneyType
+        tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
+
+        # Glow brightness for this frame (brighter, faster pulse for rare)
+        glow_alpha = int(100 + pulses.money * 100)
+        rare_glow_alpha = int(150 + pulses.rare * 105)
+
+        # Faded glow and sprite for each pickup type
+        pickup_styles = {
+            MoneyType.CHICKEN: (
+                self._get_glow_variant(self.chicken_glow_surf, glow_alpha),
+                self.chicken_sprite,
+            ),
+            MoneyType.BLACK_CHICKEN: (
+                self._get_glow_variant(self.black_chicken_glow_surf, rare_glow_alpha),
+                self.black_chicken_sprite,
+            ),
+            MoneyType.GOLD: (
+                self._get_glow_variant(self.gold_glow_surf, glow_alpha),
+                self.gold_sprite,
+            ),
+            MoneyType.SHINY_GOLD: (
+                self._get_glow_variant(self.shiny_gold_glow_surf, rare_glow_alpha),
+                self.shiny_gold_sprite,
+            ),
+        }
+
+        # Tile range whose corners fall inside the cull rect, so off-screen
+        # pickups are rejected on their map coordinates alone
+        min_x = -((offset_x + cull_rect.left) // -tile_size)
+        max_x = (offset_x + cull_rect.right - 1) // tile_size
+        min_y = -((offset_y + cull_rect.top) // -tile_size)
+        max_y = (offset_y + cull_rect.bottom - 1) // tile_size
+
+        # Glows and sprites are collected in draw order and blitted in one batch
+        pickup_blits = []
 
         for money in money_pickups:
+            x = money.x
+            y = money.y
+
+            # Skip pickups too far off-screen to be seen
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+
             if money.collected:
                 continue
 
             # Only draw if visible to current team
-            if not current_team.is_tile_revealed(money.x, money.y):
+            if (x, y) not in revealed:
                 continue
 
-            screen_x = money.x * camera.tile_size - camera.offset_x
-            screen_y = money.y * camera.tile_size - camera.offset_y
-
-            is_rare = money.is_rare()
-            is_chicken = money.is_chicken()
+            screen_x = x * tile_size - offset_x
+            screen_y = y * tile_size - offset_y
 
             # Select appropriate glow and sprite based on type
-            if money.money_type == MoneyType.CHICKEN:
-                glow_surf = self.chicken_glow_surf
-                sprite = self.chicken_sprite
-            elif money.money_type == MoneyType.BLACK_CHICKEN:
-                glow_surf = self.black_chicken_glow_surf
-                sprite = self.black_chicken_sprite
-            elif money.money_type == MoneyType.GOLD:
-                glow_surf = self.gold_glow_surf
-                sprite = self.gold_sprite
-            elif money.money_type == MoneyType.SHINY_GOLD:
-                glow_surf = self.shiny_gold_glow_surf
-                sprite = self.shiny_gold_sprite
-            else:
+            style = pickup_styles.get(money.money_type)
+            if style is None:
                 continue
+            glow_surf, sprite = style
 
-            # Draw glow (brighter for rare)
+            # Glow, then sprite on top
             if glow_surf:
-                if is_rare:
-                    glow_alpha = int(150 + rare_pulse * 105)
-                else:
-                    glow_alpha = int(100 + pulse * 100)
-                glow_surf.set_alpha(glow_alpha)
-                self._blit_centered_on_tile(glow_surf, money.x, money.y, camera)
-
-            # Draw sprite
+                pickup_blits.append(
+                    (
+                        glow_surf,
+                        self._centered_on_tile(
+                            glow_surf, screen_x, screen_y, tile_size
+                        ),
+                    )
+                )
             if sprite:
-                scaled_sprite = pygame.transform.scale(
-                    sprite, (camera.tile_size, camera.tile_size)
+                pickup_blits.append(
+                    (self._get_scaled_sprite(sprite, tile_size), (screen_x, screen_y))
                 )
-                self.screen.blit(scaled_sprite, (screen_x, screen_y))
 
-    def _draw_capital_glows(self, teams, camera, current_team, animation_timer):
-        """Draws glow effects around capitals."""
-        pulse = (math.sin(animation_timer * 0.08) + 1) / 2
+        self.screen.fblits(pickup_blits)
+
+    def _draw_capital_glows(self, teams, camera, current_team, pulses, cull_rect):
+        """
+        Draws glow effects around capitals.
+
+        Returns:
+            list: (capital, screen_x, screen_y) for each capital drawn, so the
+            capitals themselves can be drawn without walking the teams again.
+        """
+        tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
+
+        glow_alpha = int(60 + pulses.capital * 40)
+        visible = []
+        glow_blits = []
 
         for team in teams:
+            # Glow in the team's color, faded for this frame
+            glow_surf = self._get_glow_variant(
+                self._get_glow_surface(team.dark_color, 2.0), glow_alpha
+            )
+
             for capital in team.capitals:
+                screen_x = capital.x * tile_size - offset_x
+                screen_y = capital.y * tile_size - offset_y
+
+                # Skip capitals too far off-screen to be seen
+                if not cull_rect.collidepoint(screen_x, screen_y):
+                    continue
+
                 # Only draw if visible
-                if not current_team.is_tile_revealed(capital.x, capital.y):
+                if (capital.x, capital.y) not in revealed:
                     continue
 
-                # Get glow surface in team's color
-                glow_surf = self._get_glow_surface(team.dark_color, 2.0)
+                visible.append((capital, screen_x, screen_y))
 
                 if glow_surf:
-                    glow_alpha = int(60 + pulse * 40)
-                    glow_surf.set_alpha(glow_alpha)
-                    self._blit_centered_on_tile(glow_surf, capital.x, capital.y, camera)
+                    glow_blits.append(
+                        (
+                            glow_surf,
+                            self._centered_on_tile(
+                                glow_surf, screen_x, screen_y, tile_size
+                            ),
+                        )
+                    )
 
-    def _draw_capitals(self, teams, camera, current_team):
-        """Draws capital buildings."""
-        for team in teams:
-            for capital in team.capitals:
-                # Only draw if visible
-                if not current_team.is_tile_revealed(capital.x, capital.y):
-                    continue
+        self.screen.fblits(glow_blits)
 
-                screen_x = capital.x * camera.tile_size - camera.offset_x
-                screen_y = capital.y * camera.tile_size - camera.offset_y
+        return visible
 
-                # Use capital's draw method
-                capital.draw_placeholder(
-                    self.screen, screen_x, screen_y, camera.tile_size, self.capital_font
-                )
+    def _draw_capitals(self, visible_capitals, tile_size):
+        """Draws the capital buildings found by _draw_capital_glows."""
+        for capital, screen_x, screen_y in visible_capitals:
+            # Use capital's draw method
+            capital.draw_placeholder(
+                self.screen, screen_x, screen_y, tile_size, self.capital_font
+            )
 
     def _draw_character_effects(
         self,
@@ -353,39 +635,79 @@ class MapRenderer:
         camera,
         game_state,
         hovered_tile,
-        animation_timer,
+        pulses,
         current_team,
+        cull_rect,
     ):
-        """Draws glow effects for characters."""
-        pulse = (math.sin(animation_timer * 0.1) + 1) / 2
+        """
+        Draws glow effects for characters, and hover effects over them.
+
+        Returns:
+            list: (character, screen_x, screen_y) for each character drawn,
+            so the characters themselves can be drawn without walking the
+            teams again.
+        """
+        tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
+
+        # Glow brightness for this frame: brighter for the current team's
+        # characters, and brighter still for the selected one
+        pulse = pulses.character
+        selected_alpha = int(150 + pulse * 105)
+        ally_alpha = int(100 + pulse * 80)
+        enemy_alpha = int(50 + pulse * 30)
+        selected = game_state.selected_character
+        visible = []
+        glow_blits = []
+
+        # Living characters by tile, so the hover pass can look one up directly
+        living_at = {}
 
         # Draw glows for all visible characters
         for team in teams:
+            # Glows in the team's color, faded for this frame
+            glow_surf = self._get_glow_surface(team.color, 1.2)
+            if team is current_team:
+                team_glow = self._get_glow_variant(glow_surf, ally_alpha)
+                selected_glow = self._get_glow_variant(glow_surf, selected_alpha)
+            else:
+                team_glow = self._get_glow_variant(glow_surf, enemy_alpha)
+                selected_glow = team_glow
+
             for char in team.characters:
                 if char.is_dead():
                     continue
 
+                living_at[(char.x, char.y)] = char
+
+                screen_x = char.x * tile_size - offset_x
+                screen_y = char.y * tile_size - offset_y
+
+                # Skip characters too far off-screen to be seen
+                if not cull_rect.collidepoint(screen_x, screen_y):
+                    continue
+
                 # Only draw if visible to current team
-                if not current_team.is_tile_revealed(char.x, char.y):
+                if (char.x, char.y) not in revealed:
                     continue
 
-                # Get glow surface in character's team color
-                glow_surf = self._get_glow_surface(char.get_team_color(), 1.2)
+                visible.append((char, screen_x, screen_y))
+
+                if team_glow:
+                    # Even brighter if selected
+                    glow_surf = selected_glow if selected == char else team_glow
+                    glow_blits.append(
+                        (
+                            glow_surf,
+                            self._centered_on_tile(
+                                glow_surf, screen_x, screen_y, tile_size
+                            ),
+                        )
+                    )
 
-                if glow_surf:
-                    # Brighter glow for current team's characters
-                    is_current_team = char.team == current_team
-                    if is_current_team:
-                        # Even brighter if selected
-                        if game_state.selected_character == char:
-                            dynamic_alpha = int(150 + pulse * 105)
-                        else:
-                            dynamic_alpha = int(100 + pulse * 80)
-                    else:
-                        dynamic_alpha = int(50 + pulse * 30)
-
-                    glow_surf.set_alpha(dynamic_alpha)
-                    self._blit_centered_on_tile(glow_surf, char.x, char.y, camera)
+        self.screen.fblits(glow_blits)
 
         # Draw hover effects
         if hovered_tile and not game_state.game_over:
@@ -394,22 +716,26 @@ class MapRenderer:
                 camera,
                 game_state,
                 hovered_tile,
-                animation_timer,
+                pulses,
                 current_team,
+                living_at,
             )
 
+        return visible
+
     def _draw_hover_effects(
         self,
         teams,
         camera,
         game_state,
         hovered_tile,
-        animation_timer,
+        pulses,
         current_team,
+        living_at,
     ):
         """Draws hover glow effects for movement and attack."""
         htx, hty = hovered_tile
-        pulse = (math.sin(animation_timer * 0.2) + 1) / 2
+        pulse = pulses.hover
 
         # Only show hover effects when not in menus
         if game_state.show_creation_menu or game_state.show_character_menu:
@@ -419,138 +745,160 @@ class MapRenderer:
 
         if selected and selected.can_act():
             # Check if hovering over an enemy (attack)
-            target_enemy = None
-
-            for team in teams:
-                if team == current_team:
-                    continue
-                for enemy in team.characters:
-                    if not enemy.is_dead() and enemy.x == htx and enemy.y == hty:
-                        target_enemy = enemy
-                        break
-                if target_enemy:
-                    break
+            target_enemy = living_at.get(hovered_tile)
+            if target_enemy and target_enemy.team is current_team:
+                target_enemy = None
 
             if target_enemy and selected.is_in_range(htx, hty):
                 # Show attack hover glow
                 if self.attack_hover_glow_surf:
                     attack_alpha = int(150 + pulse * 105)
-                    self.attack_hover_glow_surf.set_alpha(attack_alpha)
                     self._blit_centered_on_tile(
-                        self.attack_hover_glow_surf, htx, hty, camera
+                        self._get_glow_variant(
+                            self.attack_hover_glow_surf, attack_alpha
+                        ),
+                        htx,
+                        hty,
+                        camera,
                     )
             elif selected.is_valid_move(htx, hty):
                 # Check if tile is not occupied
-                all_chars = []
-                all_capitals = []
-                for team in teams:
-                    all_chars.extend(team.characters)
-                    all_capitals.extend(team.capitals)
-
-                occupied = any(
-                    c.x == htx and c.y == hty and not c.is_dead() for c in all_chars
-                )
-                capital_occupied = any(c.x == htx and c.y == hty for c in all_capitals)
-
-                if not occupied and not capital_occupied:
+                if not self._is_tile_occupied(teams, living_at, htx, hty):
                     # Show movement hover glow
                     if self.hover_glow_surf:
                         self._blit_centered_on_tile(
                             self.hover_glow_surf, htx, hty, camera
                         )
 
-    def _draw_hospitals(self, teams, camera, current_team):
-        """Draws hospital buildings."""
+    def _is_tile_occupied(self, teams, living_at, tile_x, tile_y):
+        """Checks if a living character or a capital stands on a tile."""
+        if (tile_x, tile_y) in living_at:
+            return True
         for team in teams:
-            if not hasattr(team, "hospitals"):
-                continue
+            for capital in team.capitals:
+                if capital.x == tile_x and capital.y == tile_y:
+                    return True
+        return False
 
+    def _draw_hospitals(self, teams, camera, current_team, cull_rect):
+        """Draws hospital buildings."""
+        tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
+
+        for team in teams:
             for hospital in team.hospitals:
-                # Only draw if visible
-                if not current_team.is_tile_revealed(hospital.x, hospital.y):
+                screen_x = hospital.x * tile_size - offset_x
+                screen_y = hospital.y * tile_size - offset_y
+
+                # Skip hospitals too far off-screen to be seen
+                if not cull_rect.collidepoint(screen_x, screen_y):
                     continue
 
-                screen_x = hospital.x * camera.tile_size - camera.offset_x
-                screen_y = hospital.y * camera.tile_size - camera.offset_y
+                # Only draw if visible
+                if (hospital.x, hospital.y) not in revealed:
+                    continue
 
                 # Use hospital's draw method
                 hospital.draw_placeholder(
-                    self.screen, screen_x, screen_y, camera.tile_size, self.capital_font
+                    self.screen, screen_x, screen_y, tile_size, self.capital_font
                 )
 
-    def _draw_mines(self, teams, camera, current_team):
+    def _draw_mines(self, teams, camera, current_team, cull_rect):
         """Draws mine buildings."""
-        for team in teams:
-            if not hasattr(team, "mines"):
-                continue
+        tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
 
+        for team in teams:
             for mine in team.mines:
-                # Only draw if visible
-                if not current_team.is_tile_revealed(mine.x, mine.y):
+                screen_x = mine.x * tile_size - offset_x
+                screen_y = mine.y * tile_size - offset_y
+
+                # Skip mines too far off-screen to be seen
+                if not cull_rect.collidepoint(screen_x, screen_y):
                     continue
 
-                screen_x = mine.x * camera.tile_size - camera.offset_x
-                screen_y = mine.y * camera.tile_size - camera.offset_y
+                # Only draw if visible
+                if (mine.x, mine.y) not in revealed:
+                    continue
 
                 # Use mine's draw method
                 mine.draw_placeholder(
-                    self.screen, screen_x, screen_y, camera.tile_size, self.capital_font
+                    self.screen, screen_x, screen_y, tile_size, self.capital_font
                 )
 
-    def _draw_seer_effects(self, teams, camera, animation_timer, current_team):
-        """Draws glow effects for seers."""
-        pulse = (
-            math.sin(animation_timer * 0.15) + 1
-        ) / 2  # Slightly faster pulse for seers
+    def _draw_seer_effects(self, teams, camera, pulses, current_team, cull_rect):
+        """
+        Draws glow effects for seers.
+
+        Returns:
+            list: (seer, screen_x, screen_y) for each seer drawn, so the seers
+            themselves can be drawn without walking the teams again.
+        """
+        tile_size = camera.tile_size
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        revealed = current_team.revealed_tiles
+
+        # Seers have a mystical pulsing glow, slightly faster than characters
+        pulse = pulses.seer
+        ally_alpha = int(120 + pulse * 100)
+        enemy_alpha = int(60 + pulse * 40)
+        visible = []
+        glow_blits = []
 
         for team in teams:
-            if not hasattr(team, "seers"):
-                continue
+            # Glow in the team's color (slightly larger), faded for this frame
+            glow_surf = self._get_glow_variant(
+                self._get_glow_surface(team.color, 1.4),
+                ally_alpha if team is current_team else enemy_alpha,
+            )
 
             for seer in team.seers:
+                screen_x = seer.x * tile_size - offset_x
+                screen_y = seer.y * tile_size - offset_y
+
+                # Skip seers too far off-screen to be seen
+                if not cull_rect.collidepoint(screen_x, screen_y):
+                    continue
+
                 # Only draw if visible to current team
-                if not current_team.is_tile_revealed(seer.x, seer.y):
+                if (seer.x, seer.y) not in revealed:
                     continue
 
-                # Get glow surface in seer's team color (slightly larger glow)
-                glow_surf = self._get_glow_surface(seer.get_team_color(), 1.4)
+                visible.append((seer, screen_x, screen_y))
 
                 if glow_surf:
-                    # Seers have a mystical pulsing glow
-                    is_current_team = seer.team == current_team
-                    if is_current_team:
-                        dynamic_alpha = int(120 + pulse * 100)
-                    else:
-                        dynamic_alpha = int(60 + pulse * 40)
-
-                    glow_surf.set_alpha(dynamic_alpha)
-                    self._blit_centered_on_tile(glow_surf, seer.x, seer.y, camera)
-
-    def _draw_seers(self, teams, camera, current_team):
-        """Draws all seers with name labels."""
-        for team in teams:
-            if not hasattr(team, "seers"):
-                continue
+                    glow_blits.append(
+                        (
+                            glow_surf,
+                            self._centered_on_tile(
+                                glow_surf, screen_x, screen_y, tile_size
+                            ),
+                        )
+                    )
 
-            for seer in team.seers:
-                # Only draw if visible to current team
-                if not current_team.is_tile_revealed(seer.x, seer.y):
-                    continue
+        self.screen.fblits(glow_blits)
 
-                sprite = seer.get_display_sprite()
-                if not sprite:
-                    continue
+        return visible
 
-                screen_x = seer.x * camera.tile_size - camera.offset_x
-                screen_y = seer.y * camera.tile_size - camera.offset_y
+    def _draw_seers(self, visible_seers, tile_size):
+        """Draws the seers found by _draw_seer_effects, with name labels."""
+        blit = self.screen.blit
 
-                scaled_sprite = pygame.transform.scale(
-                    sprite, (camera.tile_size, camera.tile_size)
-                )
-                self.screen.blit(scaled_sprite, (screen_x, screen_y))
+        for seer, screen_x, screen_y in visible_seers:
+            sprite = seer.get_display_sprite()
+            if not sprite:
+                continue
+
+            scaled_sprite = self._get_scaled_sprite(sprite, tile_size)
+            blit(scaled_sprite, (screen_x, screen_y))
 
-                # Draw player name above seer
-                self._draw_seer_name(seer, screen_x, screen_y, camera.tile_size)
+            # Draw player name above seer
+            self._draw_seer_name(seer, screen_x, screen_y, tile_size)
 
     def _draw_seer_name(self, seer, screen_x, screen_y, tile_size):
         """Draws the player's name above the seer sprite with 'Seer' suffix."""
@@ -560,57 +908,29 @@ class MapRenderer:
         # Get the team/player name with Seer suffix
         name = f"{seer.team.name}"
 
-        # Render name text with team color
-        text_color = seer.get_team_light_color()
-        name_surf = self.name_font.render(name, True, text_color)
-
-        # Create shadow for readability
-        shadow_surf = self.name_font.render(name, True, (0, 0, 0))
+        # Name in team color, with its shadow
+        label = self._get_name_label(name, seer.get_team_light_color())
 
         # Position above the sprite
-        name_rect = name_surf.get_rect(
-            centerx=screen_x + tile_size // 2, bottom=screen_y - 2
-        )
-
-        # Draw shadow slightly offset
-        shadow_rect = name_rect.copy()
-        shadow_rect.x += 1
-        shadow_rect.y += 1
-        self.screen.blit(shadow_surf, shadow_rect)
-
-        # Draw main text
-        self.screen.blit(name_surf, name_rect)
-
-    def _draw_characters(self, teams, camera, current_team):
-        """Draws all characters with name labels."""
-        for team in teams:
-            for char in team.characters:
-                if char.is_dead():
-                    continue
-
-                # Only draw if visible to current team
-                if not current_team.is_tile_revealed(char.x, char.y):
-                    continue
+        self._blit_name_label(label, screen_x + tile_size // 2, screen_y - 2)
 
-                sprite = char.get_display_sprite()
-                if not sprite:
-                    continue
+    def _draw_characters(self, visible_characters, tile_size):
+        """Draws the characters found by _draw_character_effects, with name labels."""
+        blit = self.screen.blit
 
-                screen_x = char.x * camera.tile_size - camera.offset_x
-                screen_y = char.y * camera.tile_size - camera.offset_y
+        for char, screen_x, screen_y in visible_characters:
+            sprite = char.get_display_sprite()
+            if not sprite:
+                continue
 
-                scaled_sprite = pygame.transform.scale(
-                    sprite, (camera.tile_size, camera.tile_size)
-                )
-                self.screen.blit(scaled_sprite, (screen_x, screen_y))
+            scaled_sprite = self._get_scaled_sprite(sprite, tile_size)
+            blit(scaled_sprite, (screen_x, screen_y))
 
-                # Draw health bar above character, then name above that
-                self._draw_character_health_bar(
-                    char, screen_x, screen_y, camera.tile_size
-                )
+            # Draw health bar above character, then name above that
+            self._draw_character_health_bar(char, screen_x, screen_y, tile_size)
 
-                # Draw player name above the health bar
-                self._draw_character_name(char, screen_x, screen_y, camera.tile_size)
+            # Draw player name above the health bar
+            self._draw_character_name(char, screen_x, screen_y, tile_size)
 
     def _draw_character_name(self, char, screen_x, screen_y, tile_size):
         """Draws the player's name above the health bar."""
@@ -620,45 +940,65 @@ class MapRenderer:
         # Get the team/player name
         name = char.team.name
 
-        # Render name text with team color
-        text_color = char.get_team_light_color()
-        name_surf = self.name_font.render(name, True, text_color)
-
-        # Create shadow for readability
-        shadow_surf = self.name_font.render(name, True, (0, 0, 0))
+        # Name in team color, with its shadow
+        label = self._get_name_label(name, char.get_team_light_color())
 
         # Position above the health bar (health bar is at screen_y - 12, height 8)
-        name_rect = name_surf.get_rect(
-            centerx=screen_x + tile_size // 2, bottom=screen_y - 22
+        self._blit_name_label(label, screen_x + tile_size // 2, screen_y - 22)
+
+    def _get_name_label(self, name, text_color):
+        """Returns a name rendered in a color over a 1px-offset black shadow."""
+        key = (name, tuple(text_color))
+        label = self.name_label_cache.get(key)
+        if label is None:
+            name_surf = self.name_font.render(name, True, text_color)
+            # Create shadow for readability
+            shadow_surf = self.name_font.render(name, True, BLACK)
+
+            # Compose in premultiplied alpha so the label blends onto the
+            # screen the same as blitting the shadow and text one by one
+            width, height = name_surf.get_size()
+            label = pygame.Surface((width + 1, height + 1), pygame.SRCALPHA)
+            label.blit(
+                shadow_surf.premul_alpha(),
+                (1, 1),
+                special_flags=pygame.BLEND_PREMULTIPLIED,
+            )
+            label.blit(
+                name_surf.premul_alpha(),
+                (0, 0),
+                special_flags=pygame.BLEND_PREMULTIPLIED,
+            )
+            label = label.convert_alpha()
+            self.name_label_cache[key] = label
+        return label
+
+    def _blit_name_label(self, label, centerx, bottom):
+        """Blits a name label with its text centered on centerx above bottom."""
+        # The label is one pixel larger than the text to fit the shadow
+        text_width = label.get_width() - 1
+        text_height = label.get_height() - 1
+        self.screen.blit(
+            label,
+            (centerx - text_width // 2, bottom - text_height),
+            special_flags=pygame.BLEND_PREMULTIPLIED,
         )
 
-        # Draw shadow slightly offset
-        shadow_rect = name_rect.copy()
-        shadow_rect.x += 1
-        shadow_rect.y += 1
-        self.screen.blit(shadow_surf, shadow_rect)
-
-        # Draw main text
-        self.screen.blit(name_surf, name_rect)
-
     def _draw_character_health_bar(self, char, screen_x, screen_y, tile_size):
         """Draws a prominent health bar above a character."""
+        if not self.health_bar_bg:
+            return
+
         bar_width = tile_size + 4  # Slightly wider than tile
-        bar_height = 6  # Good visibility
         bar_x = screen_x - 2  # Center over sprite
         bar_y = screen_y - 10  # Above sprite
 
-        # Draw shadow/outline for visibility
-        shadow_rect = (bar_x + 1, bar_y + 1, bar_width, bar_height)
-        pygame.draw.rect(self.screen, (0, 0, 0), shadow_rect, border_radius=2)
+        # Shadow, background and border are pre-rendered
+        self.screen.blit(self.health_bar_bg, (bar_x, bar_y))
 
-        # Background
-        bg_rect = (bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, (30, 25, 20), bg_rect, border_radius=2)
-
-        # Health fill
+        # Health fill - only the part inside the 2px border is visible
         health_ratio = char.health / char.max_health
-        fill_width = int((bar_width - 2) * health_ratio)
+        fill_width = min(int((bar_width - 2) * health_ratio) - 1, bar_width - 4)
 
         if fill_width > 0:
             # Color based on health level - goes from team color to red as health drops
@@ -672,35 +1012,56 @@ class MapRenderer:
                 # Red critical
                 fill_color = (200, 50, 50)
 
-            fill_rect = (bar_x + 1, bar_y + 1, fill_width, bar_height - 2)
-            pygame.draw.rect(self.screen, fill_color, fill_rect, border_radius=1)
-
-            # Add highlight on top half for 3D effect
-            highlight_color = (
-                min(255, fill_color[0] + 40),
-                min(255, fill_color[1] + 40),
-                min(255, fill_color[2] + 40),
+            self.screen.blit(
+                self._get_health_fill(fill_color),
+                (bar_x + 2, bar_y + 2),
+                (0, 0, fill_width, 2),
             )
-            highlight_rect = (bar_x + 1, bar_y + 1, fill_width, (bar_height - 2) // 2)
-            pygame.draw.rect(
-                self.screen, highlight_color, highlight_rect, border_radius=1
-            )
-
-        # Border
-        pygame.draw.rect(self.screen, (100, 90, 70), bg_rect, 2, border_radius=2)
 
         # Don't draw HP text on bar - it's too small and cluttered
         # The bar visual is enough
 
+    def _get_cull_rect(self, camera, teams):
+        """
+        Returns the screen-space area an entity's tile corner must lie in
+        for any part of it to be visible.
+        """
+        margin = camera.tile_size * CULL_MARGIN_TILES
+        if self.name_font:
+            # Name labels are centred on the tile and at low zoom can reach
+            # further than the tile margin: half the tile, half the widest
+            # label (rounded up) and the 1px shadow
+            widest = max(
+                (self.name_font.size(team.name)[0] for team in teams), default=0
+            )
+            margin = max(margin, camera.tile_size // 2 + (widest + 1) // 2 + 1)
+        return pygame.Rect(
+            -margin,
+            -margin,
+            self.screen_width + margin * 2,
+            self.screen_height + margin * 2,
+        )
+
     def _blit_centered_on_tile(self, surface, tile_x, tile_y, camera):
         """Helper to draw a surface centered on a specific tile."""
-        tile_screen_x = tile_x * camera.tile_size - camera.offset_x
-        tile_screen_y = tile_y * camera.tile_size - camera.offset_y
-
-        surf_rect = surface.get_rect()
-        surf_rect.center = (
-            tile_screen_x + camera.tile_size / 2,
-            tile_screen_y + camera.tile_size / 2,
+        tile_size = camera.tile_size
+        self.screen.blit(
+            surface,
+            self._centered_on_tile(
+                surface,
+                tile_x * tile_size - camera.offset_x,
+                tile_y * tile_size - camera.offset_y,
+                tile_size,
+            ),
         )
 
-        self.screen.blit(surface, surf_rect.topleft)
+    def _centered_on_tile(self, surface, screen_x, screen_y, tile_size):
+        """Returns the blit position that centers a surface on a tile on screen."""
+        width, height = surface.get_size()
+
+        # Integer math throughout, so no Rect is built per blit
+        half_tile = tile_size // 2
+        return (
+            screen_x + half_tile - width // 2,
+            screen_y + half_tile - height // 2,
+        )
@@ -1,5 +1,6 @@
 import asyncio
-import math
+import logging
+import os
 import time
 
 import pygame
@@ -20,6 +21,9 @@ from ui import UIManager
 from world import WorldGenerator
 from effects import VisualEffectsManager
 
+# Placement diagnostics; enable with logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger("republic")
+
 # --- Screen Constants ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
@@ -30,6 +34,9 @@ DEFAULT_MAP_HEIGHT = 125
 INITIAL_TILE_SIZE = 32
 ZOOM_SPEED = 1
 SCROLL_SPEED = 10
+FPS = 60
+FRAME_TIME = 1.0 / FPS  # Seconds per frame at the target frame rate
+SLEEP_SLACK = 0.002  # Seconds of each frame left to clock.tick instead of asyncio
 
 # Capital spawn margins
 CAPITAL_MARGIN = 15  # Distance from map edge for starting capitals
@@ -44,10 +51,24 @@ class Game:
             (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE
         )
         pygame.display.set_caption("REPUBLIC")
+        # Motion events are never handled (hover and held keys are polled),
+        # so keep them out of the queue instead of draining them each frame
+        pygame.event.set_blocked(
+            [
+                pygame.MOUSEMOTION,
+                pygame.ACTIVEEVENT,
+                pygame.VIDEOEXPOSE,
+                pygame.JOYAXISMOTION,
+                pygame.JOYBALLMOTION,
+                pygame.JOYHATMOTION,
+            ]
+        )
         self.clock = pygame.time.Clock()
         self.running = True
         self.is_fullscreen = False
         self.windowed_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.current_screen_width = SCREEN_WIDTH
+        self.current_screen_height = SCREEN_HEIGHT
 
         # Initialize asset manager (always needed)
         self.asset_manager = AssetManager()
@@ -67,11 +88,19 @@ class Game:
         self.fog_of_war = None
         self.ui_manager = None
         self.money_pickups = []
+        self.money_at = {}  # (x, y) -> uncollected Money pickup on that tile
 
         # Map dimensions (set from menu)
         self.map_width = DEFAULT_MAP_WIDTH
         self.map_height = DEFAULT_MAP_HEIGHT
 
+        # Map click handlers for each UI placement mode
+        self.placement_handlers = {
+            "capital": self._handle_capital_placement,
+            "hospital": self._handle_hospital_placement,
+            "mine": self._handle_mine_placement,
+        }
+
         # UI state
         self.hovered_tile = None
         self.animation_timer = 0
@@ -85,6 +114,9 @@ class Game:
         # Audio & Visual FX
         self.effects_manager = VisualEffectsManager(SCREEN_WIDTH, SCREEN_HEIGHT)
         
+        # Music files found on disk, resolved once per track type
+        self.music_paths = {}
+
         # Load theme song if available
         self._load_and_play_music()
 
@@ -94,31 +126,40 @@ class Game:
         if self.main_menu and not self.main_menu.music_enabled:
             return
 
-        import os
-        
-        # Determine filename based on track type
-        filename = "intro.wav" if track_type == "intro" else "main.wav"
-        
-        # Try to find the file in assets/music or root
-        paths_to_try = [
-            os.path.join(self.asset_manager.get_resource_path(""), "assets", "music", filename),
-            os.path.join("assets", "music", filename),
-            filename # Fallback to root
-        ]
-        
-        for path in paths_to_try:
-            if os.path.exists(path):
-                try:
-                    pygame.mixer.music.load(path)
-                    pygame.mixer.music.set_volume(0.5)
-                    pygame.mixer.music.play(-1) # Loop forever
-                    print(f"Playing music: {path}")
-                    return
-                except pygame.error as e:
-                    print(f"Failed to play music {path}: {e}")
+        for path in self._get_music_paths(track_type):
+            try:
+                pygame.mixer.music.load(path)
+                pygame.mixer.music.set_volume(0.5)
+                pygame.mixer.music.play(-1) # Loop forever
+                print(f"Playing music: {path}")
+                return
+            except pygame.error as e:
+                print(f"Failed to play music {path}: {e}")
         
         print(f"No music found for {track_type}")
 
+    def _get_music_paths(self, track_type):
+        """Returns the existing music files for a track type, probing disk once."""
+        paths = self.music_paths.get(track_type)
+        if paths is None:
+            # Determine filename based on track type
+            filename = "intro.wav" if track_type == "intro" else "main.wav"
+
+            # Try to find the file in assets/music or root
+            paths_to_try = [
+                os.path.join(
+                    self.asset_manager.get_resource_path(""),
+                    "assets",
+                    "music",
+                    filename,
+                ),
+                os.path.join("assets", "music", filename),
+                filename,  # Fallback to root
+            ]
+            paths = [path for path in paths_to_try if os.path.exists(path)]
+            self.music_paths[track_type] = paths
+        return paths
+
     async def run(self):
         """Starts and runs the main game loop."""
         print("Loading assets...")
@@ -129,16 +170,20 @@ class Game:
 
         print("Game ready. Opening main menu.")
 
+        frame_start = time.perf_counter()
         while self.running:
-            # Handle resize events here properly before standard event loop
-            for event in pygame.event.get(pygame.VIDEORESIZE):
-                self._handle_resize(event.w, event.h)
-                
             self.events()
             self.update()
             self.draw()
-            self.clock.tick(60)
-            await asyncio.sleep(0)  # Yield control for web async loop
+
+            # Hand the idle part of the frame to the async loop in one await
+            # so the web build isn't made to sleep twice per frame. The await
+            # stops a little short because event loop timers tend to wake
+            # late; the tick afterwards tops up the rest precisely.
+            remaining = FRAME_TIME - (time.perf_counter() - frame_start)
+            await asyncio.sleep(max(0.0, remaining - SLEEP_SLACK))
+            self.clock.tick(FPS)
+            frame_start = time.perf_counter()
 
         # Cleanup LAN server if running
         self.main_menu.cleanup()
@@ -181,17 +226,9 @@ class Game:
 
         # Create scaled textures and glow surfaces
         self.asset_manager.rescale_textures(self.camera.tile_size)
-        self.renderer.create_glow_surfaces(self.camera.tile_size)
 
-        # Set up renderer with pickup sprites and fog tile
-        self.renderer.set_chicken_sprite(self.asset_manager.get_chicken_sprite(False))
-        self.renderer.set_black_chicken_sprite(
-            self.asset_manager.get_chicken_sprite(True)
-        )
-        self.renderer.set_gold_sprite(self.asset_manager.get_gold_sprite(False))
-        self.renderer.set_shiny_gold_sprite(self.asset_manager.get_gold_sprite(True))
-        self.renderer.set_pickup_glows(self.camera.tile_size)
-        self.renderer.set_fog_tile(self.asset_manager.get_fog_tile())
+        # Set up renderer with glows, pickup sprites and fog tile
+        self.renderer.rebind_sprites(self.asset_manager, self.camera.tile_size)
 
         # Initialize game state
         self.game_state = GameState(num_players=game_settings.num_players)
@@ -246,8 +283,8 @@ class Game:
             self.camera.center_on_entity(self.teams[0].capitals[0])
 
         # Initialize timers
-        self.game_start_time = time.time()
-        self.turn_start_time = time.time()
+        self.game_start_time = time.monotonic()
+        self.turn_start_time = time.monotonic()
         self.total_game_time = 0
         self.current_turn_time = 0
 
@@ -259,6 +296,8 @@ class Game:
         self.money_pickups = Money.generate_money_positions(
             self.world.world_map, self.map_width, self.map_height
         )
+        # Pickups never share a tile, so moves can find theirs by position
+        self.money_at = {(m.x, m.y): m for m in self.money_pickups}
         print(f"Generated {len(self.money_pickups)} money pickups.")
 
     def _setup_starting_positions(self):
@@ -329,13 +368,14 @@ class Game:
 
     def _find_valid_capital_y(self, x, preferred_y):
         """Finds a valid y position for a capital at the given x coordinate."""
+        world_map = self.world.world_map
+        map_height = self.map_height
+
         # Try preferred position first, then expand outward
-        for offset in range(0, self.map_height // 2):
-            for y in [preferred_y + offset, preferred_y - offset]:
-                if 0 <= y < self.map_height:
-                    tile = self.world.world_map[y][x]
-                    if tile != "water":
-                        return y
+        for offset in range(0, map_height // 2):
+            for y in (preferred_y + offset, preferred_y - offset):
+                if 0 <= y < map_height and world_map[y][x] != "water":
+                    return y
         return preferred_y  # Fallback
 
     def _create_starting_character(self, team, capital, char_type):
@@ -356,29 +396,6 @@ class Game:
                     return char
         return None
 
-    def _handle_resize(self, w, h):
-        """Handles window resize events."""
-        self.screen = pygame.display.set_mode((w, h), pygame.RESIZABLE)
-        self.windowed_size = (w, h)
-        
-        # Update UI
-        if self.ui_manager:
-            self.ui_manager.screen_width = w
-            self.ui_manager.screen_height = h
-            self.ui_manager._update_rects()
-            
-        # Update Effects
-        if self.effects_manager:
-            self.effects_manager.resize(w, h)
-            
-        # Update Camera if game is active
-        if self.camera:
-            self.camera.screen_width = w
-            self.camera.screen_height = h
-            # Force rescale/redraw
-            self.asset_manager.rescale_textures(self.camera.tile_size)
-            self.renderer.update_screen(self.screen)
-
     def events(self):
         """Handles user input and events."""
         for event in pygame.event.get():
@@ -386,6 +403,15 @@ class Game:
                 self.running = False
                 continue
 
+            # Handle window resize (always, even while the menu is open or
+            # before the game is initialized). The display surface already
+            # tracks the new window size, so only the layout needs updating.
+            if event.type == pygame.VIDEORESIZE:
+                if not self.is_fullscreen:
+                    self.windowed_size = (event.w, event.h)
+                self._handle_resize(event.w, event.h)
+                continue
+
             # Always check for menu button click first (even when menu is closed)
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.main_menu.menu_button_rect.collidepoint(event.pos):
@@ -399,8 +425,8 @@ class Game:
                     settings = self.main_menu.game_settings
                     self._initialize_game(settings)
                     self.game_initialized = True
-                    self.game_start_time = time.time()
-                    self.turn_start_time = time.time()
+                    self.game_start_time = time.monotonic()
+                    self.turn_start_time = time.monotonic()
                     self.main_menu.close_menu()
                 elif menu_action == "resume":
                     pass
@@ -414,16 +440,6 @@ class Game:
                         pygame.mixer.music.pause()
                 continue # Continue to next event if menu is open
 
-            # Handle window resize (always, even before game initialized)
-            if event.type == pygame.VIDEORESIZE:
-                if not self.is_fullscreen:
-                    self.windowed_size = (event.w, event.h)
-                    self.screen = pygame.display.set_mode(
-                        self.windowed_size, pygame.RESIZABLE
-                    )
-                    self._handle_resize(event.w, event.h)
-                continue
-
             # F11 toggles fullscreen (always available)
             if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
                 self._toggle_fullscreen()
@@ -479,6 +495,11 @@ class Game:
 
     def _handle_resize(self, width, height):
         """Handles window resize - rescales UI and game elements."""
+        # Nothing to relayout if the size didn't change (e.g. the resize event
+        # that follows set_mode in _toggle_fullscreen)
+        if (width, height) == (self.current_screen_width, self.current_screen_height):
+            return
+
         # Store current screen dimensions
         self.current_screen_width = width
         self.current_screen_height = height
@@ -510,31 +531,26 @@ class Game:
                 self.camera.min_zoom_level + 10, int(min(width / 5, height / 5))
             )
             # Clamp current tile size to new limits
+            old_tile_size = self.camera.tile_size
             self.camera.tile_size = max(
                 self.camera.min_zoom_level,
                 min(self.camera.max_zoom_level, self.camera.tile_size),
             )
             self.camera.clamp_and_center()
-            # Rescale textures for potentially new tile size
-            self.asset_manager.rescale_textures(self.camera.tile_size)
-            if self.renderer:
-                self.renderer.create_glow_surfaces(self.camera.tile_size)
-                self.renderer.set_chicken_sprite(
-                    self.asset_manager.get_chicken_sprite(False)
-                )
-                self.renderer.set_black_chicken_sprite(
-                    self.asset_manager.get_chicken_sprite(True)
-                )
-                self.renderer.set_gold_sprite(self.asset_manager.get_gold_sprite(False))
-                self.renderer.set_shiny_gold_sprite(
-                    self.asset_manager.get_gold_sprite(True)
-                )
-                self.renderer.set_pickup_glows(self.camera.tile_size)
-                self.renderer.set_fog_tile(self.asset_manager.get_fog_tile())
+            # Textures must match the grid on the very next frame. The clamp
+            # rarely changes the tile size, so a drag seldom rescales.
+            if self.camera.tile_size != old_tile_size:
+                self._rescale_assets()
         elif self.renderer:
             # Even without camera, update renderer's glow surfaces for menu
             self.renderer.create_glow_surfaces(INITIAL_TILE_SIZE)
 
+    def _rescale_assets(self):
+        """Rescales textures and renderer sprites to the camera's tile size."""
+        self.asset_manager.rescale_textures(self.camera.tile_size)
+        if self.renderer:
+            self.renderer.rebind_sprites(self.asset_manager, self.camera.tile_size)
+
     def _handle_end_turn(self):
         """Handles the end turn action and camera refocus."""
         # Reset placement modes
@@ -550,7 +566,7 @@ class Game:
         self.game_state.end_turn(self.teams)
 
         # Reset turn timer
-        self.turn_start_time = time.time()
+        self.turn_start_time = time.monotonic()
 
         # Update fog of war for the new active team
         current_team = self._get_current_team()
@@ -562,7 +578,7 @@ class Game:
 
     def _process_seer_movements(self, team):
         """Processes automatic seer movements for a team."""
-        if not hasattr(team, "seers") or not team.seers:
+        if not team.seers:
             return
 
         # Gather all characters and capitals for collision detection
@@ -573,10 +589,8 @@ class Game:
         for t in self.teams:
             all_chars.extend(t.characters)
             all_capitals.extend(t.capitals)
-            if hasattr(t, "seers"):
-                all_seers.extend(t.seers)
-            if hasattr(t, "hospitals"):
-                all_hospitals.extend(t.hospitals)
+            all_seers.extend(t.seers)
+            all_hospitals.extend(t.hospitals)
 
         # Process each seer's movements
         for seer in team.seers:
@@ -598,8 +612,8 @@ class Game:
                 if not moved:
                     break
 
-                # Update fog of war after each move
-                self.fog_of_war.update_team_visibility(team, self.teams)
+                # Reveal around the seer's new position after each move
+                self.fog_of_war.reveal_around_entity(team, seer)
 
             seer.has_acted_this_turn = True
 
@@ -611,8 +625,11 @@ class Game:
         """Centers the camera on a team's capital or character."""
         if team.capitals:
             self.camera.center_on_entity(team.capitals[0])
-        elif team.get_living_characters():
-            self.camera.center_on_entity(team.get_living_characters()[0])
+            return
+
+        living = team.get_living_characters()
+        if living:
+            self.camera.center_on_entity(living[0])
 
     def _get_focus_entity(self):
         """Returns the entity that should be the focus for camera operations."""
@@ -623,8 +640,9 @@ class Game:
         if current_team:
             if current_team.capitals:
                 return current_team.capitals[0]
-            elif current_team.get_living_characters():
-                return current_team.get_living_characters()[0]
+            living = current_team.get_living_characters()
+            if living:
+                return living[0]
 
         # Fallback to center of map
         class MapCenter:
@@ -652,29 +670,17 @@ class Game:
             return
 
         # Calculate clicked tile
-        tile_x = math.floor(
-            (mouse_pos[0] + self.camera.offset_x) / self.camera.tile_size
-        )
-        tile_y = math.floor(
-            (mouse_pos[1] + self.camera.offset_y) / self.camera.tile_size
-        )
+        # Camera offsets are ints, so floor division gives the tile directly
+        tile_size = self.camera.tile_size
+        tile_x = (mouse_pos[0] + self.camera.offset_x) // tile_size
+        tile_y = (mouse_pos[1] + self.camera.offset_y) // tile_size
 
         # Handle placement mode (placing capital, hospital, or mine on map)
         # This must be checked BEFORE closing menus
-        print(f"DEBUG: placement_mode = {self.ui_manager.placement_mode}")
-        if self.ui_manager.placement_mode:
-            print(
-                f"DEBUG: In placement mode '{self.ui_manager.placement_mode}', clicking at tile ({tile_x}, {tile_y})"
-            )
-            if self.ui_manager.placement_mode == "capital":
-                self._handle_capital_placement(tile_x, tile_y, current_team)
-                return
-            elif self.ui_manager.placement_mode == "hospital":
-                self._handle_hospital_placement(tile_x, tile_y, current_team)
-                return
-            elif self.ui_manager.placement_mode == "mine":
-                self._handle_mine_placement(tile_x, tile_y, current_team)
-                return
+        place = self.placement_handlers.get(self.ui_manager.placement_mode)
+        if place:
+            place(tile_x, tile_y, current_team)
+            return
 
         # If creation menu is open but clicked outside it (and not in placement mode), close it
         if self.game_state.show_creation_menu:
@@ -696,73 +702,91 @@ class Game:
                 self.game_state.close_character_menu()
             return
 
-        # Check if clicking on own capital (open character menu or upgrade)
-        for capital in current_team.capitals:
-            if capital.x == tile_x and capital.y == tile_y:
-                # If shift is held and can upgrade, upgrade instead
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
-                    if capital.can_upgrade():
-                        capital.upgrade()
-                        return
-                    else:
-                        print(
-                            "Cannot upgrade capital (already upgraded or can't afford)"
-                        )
-                        return
-                # Otherwise open character menu
-                if capital.can_spawn_character():
-                    self.game_state.open_character_menu(capital)
-                return
+        # Look up what the current team owns on the clicked tile
+        kind, entity = self._get_own_tile_index(current_team).get(
+            (tile_x, tile_y), (None, None)
+        )
 
-        # Check if clicking on own hospital (upgrade with shift)
-        if hasattr(current_team, "hospitals"):
-            for hospital in current_team.hospitals:
-                if hospital.x == tile_x and hospital.y == tile_y:
-                    keys = pygame.key.get_pressed()
-                    if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
-                        if hospital.can_upgrade():
-                            hospital.upgrade()
-                        else:
-                            print(
-                                "Cannot upgrade hospital (already upgraded or can't afford)"
-                            )
-                    else:
-                        # Trigger heal if possible
-                        if hospital.can_heal(current_team):
-                            healed = hospital.heal_characters(current_team.characters)
-                            if healed > 0:
-                                print(f"Hospital healed {healed} character(s)")
+        # Clicking on own capital (open character menu or upgrade)
+        if kind == "capital":
+            capital = entity
+            # If shift is held and can upgrade, upgrade instead
+            if self._is_shift_held():
+                if capital.can_upgrade():
+                    capital.upgrade()
                     return
-
-        # Check if clicking on own mine (upgrade with shift)
-        if hasattr(current_team, "mines"):
-            for mine in current_team.mines:
-                if mine.x == tile_x and mine.y == tile_y:
-                    keys = pygame.key.get_pressed()
-                    if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
-                        if mine.can_upgrade():
-                            mine.upgrade()
-                        else:
-                            print(
-                                "Cannot upgrade mine (already upgraded or can't afford)"
-                            )
+                else:
+                    print("Cannot upgrade capital (already upgraded or can't afford)")
                     return
+            # Otherwise open character menu
+            if capital.can_spawn_character():
+                self.game_state.open_character_menu(capital)
+            return
 
-        # Check if clicking on own character (select it)
-        for char in current_team.get_living_characters():
-            if char.x == tile_x and char.y == tile_y:
-                if self.game_state.selected_character == char:
-                    # Clicking selected character deselects it
-                    self.game_state.deselect_character()
+        # Clicking on own hospital (upgrade with shift)
+        if kind == "hospital":
+            hospital = entity
+            if self._is_shift_held():
+                if hospital.can_upgrade():
+                    hospital.upgrade()
                 else:
-                    self.game_state.select_character(char)
-                return
+                    print("Cannot upgrade hospital (already upgraded or can't afford)")
+            else:
+                # Trigger heal if possible
+                if hospital.can_heal(current_team):
+                    healed = hospital.heal_characters(current_team.characters)
+                    if healed > 0:
+                        print(f"Hospital healed {healed} character(s)")
+            return
+
+        # Clicking on own mine (upgrade with shift)
+        if kind == "mine":
+            mine = entity
+            if self._is_shift_held():
+                if mine.can_upgrade():
+                    mine.upgrade()
+                else:
+                    print("Cannot upgrade mine (already upgraded or can't afford)")
+            return
+
+        # Clicking on own character (select it)
+        if kind == "character":
+            char = entity
+            if self.game_state.selected_character == char:
+                # Clicking selected character deselects it
+                self.game_state.deselect_character()
+            else:
+                self.game_state.select_character(char)
+            return
 
         # If a character is selected, handle movement/attack
         if self.game_state.selected_character:
             self._handle_character_action(tile_x, tile_y, current_team)
 
+    def _is_shift_held(self):
+        """Returns True if either shift key is currently held down."""
+        return bool(pygame.key.get_mods() & pygame.KMOD_SHIFT)
+
+    def _get_own_tile_index(self, current_team):
+        """
+        Maps each tile holding one of the current team's clickable entities
+        to a (kind, entity) pair, built in a single pass over the team.
+
+        Entries are written lowest priority first so that when entities share
+        a tile the click resolves capital, hospital, mine, then character,
+        the same order the click handler has always checked them in.
+        """
+        tile_index = {}
+        for char in current_team.get_living_characters():
+            tile_index[(char.x, char.y)] = ("character", char)
+        for mine in current_team.mines:
+            tile_index[(mine.x, mine.y)] = ("mine", mine)
+        for hospital in current_team.hospitals:
+            tile_index[(hospital.x, hospital.y)] = ("hospital", hospital)
+        for capital in current_team.capitals:
+            tile_index[(capital.x, capital.y)] = ("capital", capital)
+        return tile_index
+
     def _handle_ui_click(self, mouse_pos, current_team):
         """Handles clicks on UI elements. Returns True if a UI element was clicked."""
         # End Turn button
@@ -791,82 +815,75 @@ class Game:
 
     def _handle_capital_placement(self, tile_x, tile_y, current_team):
         """Handles placing a new capital."""
-        print(f"DEBUG: _handle_capital_placement called at ({tile_x}, {tile_y})")
+        log.debug("Capital placement at (%d, %d)", tile_x, tile_y)
 
         # Check if team can afford
         if not current_team.can_afford(Capital.COST):
-            print(
-                f"DEBUG: Cannot afford capital (cost={Capital.COST}, money={current_team.money})"
+            log.debug(
+                "Cannot afford capital (cost=%d, money=%d)",
+                Capital.COST,
+                current_team.money,
             )
             return
 
         # Check if valid position (not water, not too close to other capitals)
         if not (0 <= tile_x < self.map_width and 0 <= tile_y < self.map_height):
-            print(
-                f"DEBUG: Out of bounds ({tile_x}, {tile_y}) map is {self.map_width}x{self.map_height}"
+            log.debug(
+                "Out of bounds (%d, %d) map is %dx%d",
+                tile_x,
+                tile_y,
+                self.map_width,
+                self.map_height,
             )
             return
 
         tile = self.world.world_map[tile_y][tile_x]
         if tile == "water":
-            print(f"DEBUG: Cannot place on water")
+            log.debug("Cannot place on water")
             return
 
         # Check if position is revealed
         if not current_team.is_tile_revealed(tile_x, tile_y):
-            print(f"DEBUG: Tile not revealed")
+            log.debug("Tile not revealed")
             return
 
-        # Gather all entities for collision check
+        # Gather all capitals for the distance check
         all_capitals = []
-        all_chars = []
-        all_hospitals = []
-        all_mines = []
-        all_seers = []
         for team in self.teams:
             all_capitals.extend(team.capitals)
-            all_chars.extend(team.characters)
-            if hasattr(team, "hospitals"):
-                all_hospitals.extend(team.hospitals)
-            if hasattr(team, "mines"):
-                all_mines.extend(team.mines)
-            if hasattr(team, "seers"):
-                all_seers.extend(team.seers)
 
         # Check distance from all capitals
         if not Capital.is_valid_capital_position(tile_x, tile_y, all_capitals):
-            print(
-                f"DEBUG: Too close to another capital (need {Capital.MIN_DISTANCE_FROM_OTHER_CAPITALS} tiles)"
+            log.debug(
+                "Too close to another capital (need %d tiles)",
+                Capital.MIN_DISTANCE_FROM_OTHER_CAPITALS,
             )
             return
 
+        occupied = self._get_occupied_tiles()
+        tile_pos = (tile_x, tile_y)
+
         # Check if position is occupied by character
-        occupied = any(
-            c.x == tile_x and c.y == tile_y and not c.is_dead() for c in all_chars
-        )
-        if occupied:
-            print("DEBUG: Position occupied by character")
+        if tile_pos in occupied["characters"]:
+            log.debug("Position occupied by character")
             return
 
         # Check if position is occupied by hospital
-        hosp_occupied = any(h.x == tile_x and h.y == tile_y for h in all_hospitals)
-        if hosp_occupied:
-            print("DEBUG: Position occupied by hospital")
+        if tile_pos in occupied["hospitals"]:
+            log.debug("Position occupied by hospital")
             return
 
         # Check if position is occupied by mine
-        mine_occupied = any(m.x == tile_x and m.y == tile_y for m in all_mines)
-        if mine_occupied:
-            print("DEBUG: Position occupied by mine")
+        if tile_pos in occupied["mines"]:
+            log.debug("Position occupied by mine")
             return
 
         # Check if position is occupied by seer
-        seer_occupied = any(s.x == tile_x and s.y == tile_y for s in all_seers)
-        if seer_occupied:
-            print("DEBUG: Position occupied by seer")
+        if tile_pos in occupied["seers"]:
+            log.debug("Position occupied by seer")
             return
 
-        print("DEBUG: All checks passed! Creating capital...")
+        log.debug("All checks passed, creating capital")
 
         # Create the capital
         current_team.spend_money(Capital.COST)
@@ -903,27 +920,13 @@ class Game:
             return
 
         # Check if position is occupied by character, capital, or other building
-        all_chars = []
-        all_capitals = []
-        all_hospitals = []
-        for t in self.teams:
-            all_chars.extend(t.characters)
-            all_capitals.extend(t.capitals)
-            if hasattr(t, "hospitals"):
-                all_hospitals.extend(t.hospitals)
-
-        occupied = any(
-            c.x == tile_x and c.y == tile_y and not c.is_dead() for c in all_chars
-        )
-        if occupied:
-            return
-
-        cap_occupied = any(c.x == tile_x and c.y == tile_y for c in all_capitals)
-        if cap_occupied:
-            return
-
-        hosp_occupied = any(h.x == tile_x and h.y == tile_y for h in all_hospitals)
-        if hosp_occupied:
+        occupied = self._get_occupied_tiles()
+        tile_pos = (tile_x, tile_y)
+        if (
+            tile_pos in occupied["characters"]
+            or tile_pos in occupied["capitals"]
+            or tile_pos in occupied["hospitals"]
+        ):
             return
 
         # Create the hospital
@@ -950,7 +953,7 @@ class Game:
 
         # Check if tile is granite (required for mines)
         tile = self.world.world_map[tile_y][tile_x]
-        if tile != "granite":
+        if tile != Mine.VALID_TERRAIN:
             print(f"Mines can only be placed on granite tiles (this is {tile})")
             return
 
@@ -958,28 +961,9 @@ class Game:
         if not current_team.is_tile_revealed(tile_x, tile_y):
             return
 
-        # Gather all entities for collision check
-        all_entities = {
-            "characters": [],
-            "capitals": [],
-            "hospitals": [],
-            "mines": [],
-            "seers": [],
-        }
-        for t in self.teams:
-            all_entities["characters"].extend(t.characters)
-            all_entities["capitals"].extend(t.capitals)
-            if hasattr(t, "hospitals"):
-                all_entities["hospitals"].extend(t.hospitals)
-            if hasattr(t, "mines"):
-                all_entities["mines"].extend(t.mines)
-            if hasattr(t, "seers"):
-                all_entities["seers"].extend(t.seers)
-
-        # Check if position is valid using Mine's validation
-        if not Mine.is_valid_position(
-            tile_x, tile_y, self.world.world_map, all_entities
-        ):
+        # Check if position is occupied by any entity
+        tile_pos = (tile_x, tile_y)
+        if any(tile_pos in tiles for tiles in self._get_occupied_tiles().values()):
             print("Position is occupied")
             return
 
@@ -1071,21 +1055,36 @@ class Game:
         # Close the menu
         self.game_state.close_character_menu()
 
+    def _get_occupied_tiles(self):
+        """
+        Collects the tiles taken by each kind of entity across all teams in
+        one pass, so placement and movement checks are set lookups.
+
+        Returns:
+            dict: "characters", "capitals", "hospitals", "mines" and "seers"
+            mapped to sets of (x, y) tuples. Dead characters are left out.
+        """
+        occupied = {
+            "characters": set(),
+            "capitals": set(),
+            "hospitals": set(),
+            "mines": set(),
+            "seers": set(),
+        }
+        for team in self.teams:
+            occupied["characters"].update(
+                (c.x, c.y) for c in team.characters if not c.is_dead()
+            )
+            occupied["capitals"].update((c.x, c.y) for c in team.capitals)
+            occupied["hospitals"].update((h.x, h.y) for h in team.hospitals)
+            occupied["mines"].update((m.x, m.y) for m in team.mines)
+            occupied["seers"].update((s.x, s.y) for s in team.seers)
+        return occupied
+
     def _find_spawn_position(self, capital):
         """Finds a valid spawn position around a capital."""
         spawn_positions = capital.get_spawn_positions()
-
-        all_chars = []
-        all_capitals = []
-        all_seers = []
-        all_hospitals = []
-        for team in self.teams:
-            all_chars.extend(team.characters)
-            all_capitals.extend(team.capitals)
-            if hasattr(team, "seers"):
-                all_seers.extend(team.seers)
-            if hasattr(team, "hospitals"):
-                all_hospitals.extend(team.hospitals)
+        occupied = self._get_occupied_tiles()
 
         for pos in spawn_positions:
             x, y = pos
@@ -1097,30 +1096,39 @@ class Game:
             if tile == "water":
                 continue
 
-            # Check if position is occupied by character
-            occupied = any(c.x == x and c.y == y and not c.is_dead() for c in all_chars)
-            if occupied:
-                continue
-
-            # Check if position is occupied by capital
-            cap_occupied = any(c.x == x and c.y == y for c in all_capitals)
-            if cap_occupied:
-                continue
-
-            # Check if position is occupied by seer
-            seer_occupied = any(s.x == x and s.y == y for s in all_seers)
-            if seer_occupied:
-                continue
-
-            # Check if position is occupied by hospital
-            hosp_occupied = any(h.x == x and h.y == y for h in all_hospitals)
-            if hosp_occupied:
+            # Check if position is occupied by character, capital, seer or hospital
+            if (
+                pos in occupied["characters"]
+                or pos in occupied["capitals"]
+                or pos in occupied["seers"]
+                or pos in occupied["hospitals"]
+            ):
                 continue
 
             return pos
 
         return None
 
+    def _get_enemy_tile_index(self, current_team):
+        """
+        Maps tiles to the enemy entities standing on them.
+
+        Returns:
+            tuple: Two dicts of (x, y) -> (team, entity), one for living enemy
+            characters and one for enemy capitals. If several share a tile,
+            the first in team order wins.
+        """
+        enemy_at = {}
+        enemy_capital_at = {}
+        for team in self.teams:
+            if team is current_team:
+                continue
+            for char in team.get_living_characters():
+                enemy_at.setdefault((char.x, char.y), (team, char))
+            for capital in team.capitals:
+                enemy_capital_at.setdefault((capital.x, capital.y), (team, capital))
+        return enemy_at, enemy_capital_at
+
     def _handle_character_action(self, tile_x, tile_y, current_team):
         """Handles movement or attack for the selected character."""
         selected = self.game_state.selected_character
@@ -1132,59 +1140,57 @@ class Game:
         if not current_team.is_tile_revealed(tile_x, tile_y):
             return
 
-        # Get all enemy teams
-        enemy_teams = [t for t in self.teams if t != current_team]
+        # Enemy characters and capitals by tile, so the clicked tile is a
+        # single lookup
+        enemy_at, enemy_capital_at = self._get_enemy_tile_index(current_team)
+        tile_pos = (tile_x, tile_y)
 
         # Check if attacking an enemy character
-        for enemy_team in enemy_teams:
-            for enemy in enemy_team.get_living_characters():
-                if enemy.x == tile_x and enemy.y == tile_y:
-                    if selected.is_in_range(tile_x, tile_y):
-                        # Attack!
-                        enemy.take_damage(selected.damage)
-
-                        # Check if enemy died
-                        enemy_killed = enemy.is_dead()
-                        if enemy_killed:
-                            enemy_team.remove_character(enemy)
-
-                        # Check victory conditions
-                        self.game_state.check_victory_conditions(self.teams)
-
-                        # Handle tank chain kills
-                        if enemy_killed and selected.is_tank() and selected.on_kill():
-                            # Tank gets another action - don't deselect
-                            # Update fog of war in case they want to move
-                            self.fog_of_war.update_team_visibility(
-                                current_team, self.teams
-                            )
-                            return
-
-                        # Normal end of action
-                        selected.has_moved = True
-                        self.game_state.deselect_character()
+        if tile_pos in enemy_at:
+            enemy_team, enemy = enemy_at[tile_pos]
+            if selected.is_in_range(tile_x, tile_y):
+                # Attack!
+                enemy.take_damage(selected.damage)
+
+                # Check if enemy died
+                enemy_killed = enemy.is_dead()
+                if enemy_killed:
+                    enemy_team.remove_character(enemy)
+
+                # Check victory conditions
+                self.game_state.check_victory_conditions(self.teams)
+
+                # Handle tank chain kills
+                if enemy_killed and selected.is_tank() and selected.on_kill():
+                    # Tank gets another action - don't deselect
+                    # Update fog of war in case they want to move
+                    self.fog_of_war.update_team_visibility(current_team, self.teams)
                     return
 
+                # Normal end of action
+                selected.has_moved = True
+                self.game_state.deselect_character()
+            return
+
         # Check if conquering an enemy capital
-        for enemy_team in enemy_teams:
-            for capital in enemy_team.capitals:
-                if capital.x == tile_x and capital.y == tile_y:
-                    if selected.is_in_range(tile_x, tile_y):
-                        # Check if capital is unprotected
-                        all_chars = []
-                        for t in self.teams:
-                            all_chars.extend(t.characters)
-
-                        if not capital.is_protected(all_chars):
-                            # Conquer the capital!
-                            enemy_team.remove_capital(capital)
-                            selected.has_moved = True
-
-                            # Check victory conditions
-                            self.game_state.check_victory_conditions(self.teams)
-
-                            self.game_state.deselect_character()
-                    return
+        if tile_pos in enemy_capital_at:
+            enemy_team, capital = enemy_capital_at[tile_pos]
+            if selected.is_in_range(tile_x, tile_y):
+                # Check if capital is unprotected
+                all_chars = []
+                for t in self.teams:
+                    all_chars.extend(t.characters)
+
+                if not capital.is_protected(all_chars):
+                    # Conquer the capital!
+                    enemy_team.remove_capital(capital)
+                    selected.has_moved = True
+
+                    # Check victory conditions
+                    self.game_state.check_victory_conditions(self.teams)
+
+                    self.game_state.deselect_character()
+            return
 
         # Check if moving to a valid tile
         if selected.is_valid_move(tile_x, tile_y):
@@ -1197,22 +1203,10 @@ class Game:
             if tile == "water":
                 return
 
-            # Check if occupied by character
-            all_chars = []
-            for t in self.teams:
-                all_chars.extend(t.characters)
-            occupied = any(
-                c.x == tile_x and c.y == tile_y and not c.is_dead() for c in all_chars
-            )
-            if occupied:
-                return
-
-            # Check if occupied by capital
-            all_capitals = []
-            for t in self.teams:
-                all_capitals.extend(t.capitals)
-            cap_occupied = any(c.x == tile_x and c.y == tile_y for c in all_capitals)
-            if cap_occupied:
+            # Check if occupied by character or capital
+            occupied = self._get_occupied_tiles()
+            tile_pos = (tile_x, tile_y)
+            if tile_pos in occupied["characters"] or tile_pos in occupied["capitals"]:
                 return
 
             # Move!
@@ -1221,8 +1215,8 @@ class Game:
             # Check for money pickup
             self._check_money_pickup(tile_x, tile_y, current_team)
 
-            # Update fog of war
-            self.fog_of_war.update_team_visibility(current_team, self.teams)
+            # Reveal around the character's new position
+            self.fog_of_war.reveal_around_entity(current_team, selected)
 
             # Check if standing on own hospital - auto heal for 1 gold
             self._check_hospital_heal(tile_x, tile_y, current_team)
@@ -1232,16 +1226,12 @@ class Game:
 
     def _check_money_pickup(self, tile_x, tile_y, team):
         """Checks if a character picked up money at the given position."""
-        for money in self.money_pickups:
-            if money.is_at(tile_x, tile_y):
-                money.collect(team)
-                break
+        money = self.money_at.pop((tile_x, tile_y), None)
+        if money is not None:
+            money.collect(team)
 
     def _check_hospital_heal(self, tile_x, tile_y, team):
         """Checks if a character is near a hospital and triggers healing."""
-        if not hasattr(team, "hospitals"):
-            return
-
         for hospital in team.hospitals:
             if hospital.is_in_heal_range(tile_x, tile_y):
                 # Gather all characters
@@ -1257,18 +1247,28 @@ class Game:
 
     def _apply_lava_damage(self, team):
         """Applies damage to characters standing on lava."""
-        # Create a copy of the list since we might remove characters
-        for char in team.get_living_characters()[:]:
-            tile = self.world.world_map[char.y][char.x]
-            if tile == "lava":
-                damage = 2
-                print(f"{char.get_type_display_name()} took {damage} damage from lava!")
-                char.take_damage(damage)
-                if char.is_dead():
-                    print(f"{char.get_type_display_name()} died in lava!")
-                    team.remove_character(char)
-                    # Check victory conditions
-                    self.game_state.check_victory_conditions(self.teams)
+        # Find everyone on lava in one pass before damaging anyone, so
+        # removing the dead does not disturb the scan
+        world_map = self.world.world_map
+        on_lava = [
+            c
+            for c in team.characters
+            if not c.is_dead() and world_map[c.y][c.x] == "lava"
+        ]
+        died = []
+        for char in on_lava:
+            damage = 2
+            print(f"{char.display_name} took {damage} damage from lava!")
+            char.take_damage(damage)
+            if char.is_dead():
+                print(f"{char.display_name} died in lava!")
+                died.append(char)
+
+        if died:
+            for char in died:
+                team.remove_character(char)
+            # Only this team lost units, so one victory check covers them all
+            self.game_state.check_victory_conditions(self.teams)
 
     def update(self):
         """Updates the state of all game components."""
@@ -1277,9 +1277,9 @@ class Game:
 
         # Update timers
         if self.game_initialized and self.game_start_time:
-            self.total_game_time = time.time() - self.game_start_time
+            self.total_game_time = time.monotonic() - self.game_start_time
             if self.turn_start_time:
-                self.current_turn_time = time.time() - self.turn_start_time
+                self.current_turn_time = time.monotonic() - self.turn_start_time
 
         # Only update game state if initialized and menu is closed
         if not self.game_initialized or self.main_menu.is_open:
@@ -1291,50 +1291,40 @@ class Game:
         needs_rescale = self.camera.update(keys, ZOOM_SPEED, SCROLL_SPEED, focus_entity)
 
         if needs_rescale:
-            self.asset_manager.rescale_textures(self.camera.tile_size)
-            self.renderer.create_glow_surfaces(self.camera.tile_size)
-            self.renderer.set_chicken_sprite(
-                self.asset_manager.get_chicken_sprite(False)
-            )
-            self.renderer.set_black_chicken_sprite(
-                self.asset_manager.get_chicken_sprite(True)
-            )
-            self.renderer.set_gold_sprite(self.asset_manager.get_gold_sprite(False))
-            self.renderer.set_shiny_gold_sprite(
-                self.asset_manager.get_gold_sprite(True)
-            )
-            self.renderer.set_pickup_glows(self.camera.tile_size)
-            self.renderer.set_fog_tile(self.asset_manager.get_fog_tile())
+            self._rescale_assets()
 
         # Update hovered tile
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        tile_size = self.camera.tile_size
         self.hovered_tile = (
-            math.floor((mouse_pos[0] + self.camera.offset_x) / self.camera.tile_size),
-            math.floor((mouse_pos[1] + self.camera.offset_y) / self.camera.tile_size),
+            (mouse_x + self.camera.offset_x) // tile_size,
+            (mouse_y + self.camera.offset_y) // tile_size,
         )
 
     def draw(self):
         """Draws the game world to the screen."""
-        # Clear screen once at start
-        self.screen.fill((15, 12, 10))
-
-        # Draw game if initialized
+        current_team = None
         if self.game_initialized and self.world:
             current_team = self._get_current_team()
-            if current_team:
-                self.renderer.draw(
-                    self.world,
-                    self.camera,
-                    self.asset_manager.scaled_textures,
-                    self.teams,
-                    self.money_pickups,
-                    self.fog_of_war,
-                    self.ui_manager,
-                    self.game_state,
-                    self.hovered_tile,
-                    self.animation_timer,
-                    current_team,
-                )
+
+        # The renderer's map layer covers the whole screen, so the clear is
+        # only needed when it does not run
+        if not current_team:
+            self.screen.fill((15, 12, 10))
+        else:
+            self.renderer.draw(
+                self.world,
+                self.camera,
+                self.asset_manager.scaled_textures,
+                self.teams,
+                self.money_pickups,
+                self.fog_of_war,
+                self.ui_manager,
+                self.game_state,
+                self.hovered_tile,
+                self.animation_timer,
+                current_team,
+            )
 
         # Draw main menu elements (single draw call handles all states)
         self.main_menu.draw(
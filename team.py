@@ -1,4 +1,5 @@
 from enum import Enum, auto
+from itertools import product
 
 
 class TeamSide(Enum):
@@ -195,9 +196,13 @@ class Team:
             center_y: Y coordinate of the center
             radius: Half-width of the square area (e.g., 3 for 7x7)
         """
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                self.revealed_tiles.add((center_x + dx, center_y + dy))
+        # product() builds the (x, y) tuples in C, column by column
+        self.revealed_tiles.update(
+            product(
+                range(center_x - radius, center_x + radius + 1),
+                range(center_y - radius, center_y + radius + 1),
+            )
+        )
 
     def is_tile_revealed(self, x, y):
         """Checks if a tile is revealed for this team."""
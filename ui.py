@@ -1,4 +1,8 @@
 import pygame
+from capital import Capital
+from hospital import Hospital
+from mine import Mine
+from seer import Seer
 
 # Greek-style fonts to try (in order of preference)
 GREEK_FONTS = [
@@ -591,8 +595,6 @@ class UIManager:
         mouse_pos = pygame.mouse.get_pos()
 
         # === CAPITAL SECTION ===
-        from capital import Capital
-
         title_surf = self.small_font.render("Create Capital", True, GOLD_ACCENT)
         surface.blit(title_surf, (x, y))
         y += 20
@@ -646,8 +648,6 @@ class UIManager:
         y += 8
 
         # === SEER SECTION ===
-        from seer import Seer
-
         seer_title = self.small_font.render("Spawn Seer (Scout)", True, GOLD_ACCENT)
         surface.blit(seer_title, (x, y))
         y += 20
@@ -691,8 +691,6 @@ class UIManager:
         y += 8
 
         # === HOSPITAL SECTION ===
-        from hospital import Hospital
-
         hosp_title = self.small_font.render("Build Hospital", True, GOLD_ACCENT)
         surface.blit(hosp_title, (x, y))
         y += 20
@@ -750,8 +748,6 @@ class UIManager:
         y += 8
 
         # === MINE SECTION ===
-        from mine import Mine
-
         mine_title = self.small_font.render("Build Mine", True, GOLD_ACCENT)
         surface.blit(mine_title, (x, y))
         y += 20
@@ -883,8 +879,6 @@ class UIManager:
 
         # Upgrade button if not upgraded
         if selected_capital and not is_upgraded:
-            from capital import Capital
-            
             # Recalculate rect based on current menu position
             # Recalculate rect based on current menu position and last button
             # Note: We duplicate the logic from _setup_char_buttons so it follows dynamic positioning
@@ -1066,30 +1060,14 @@ class UIManager:
         Returns:
             str or None: "seer" if seer should spawn, "capital"/"hospital"/"mine" if entering placement mode, None otherwise
         """
-        from capital import Capital
-        from hospital import Hospital
-        from mine import Mine
-        from seer import Seer
-
-        print(f"DEBUG UI: handle_creation_menu_click at {pos}")
-        print(f"DEBUG UI: capital_button_rect = {self.capital_button_rect}")
-        print(
-            f"DEBUG UI: current money = {current_team.money}, capital cost = {Capital.COST}"
-        )
-
         # Check capital button
         if self.capital_button_rect.collidepoint(pos):
-            print("DEBUG UI: Capital button clicked!")
             if current_team.can_afford(Capital.COST):
                 if self.placement_mode == "capital":
                     self.placement_mode = None  # Toggle off
-                    print("DEBUG UI: Toggled capital placement OFF")
                 else:
                     self.placement_mode = "capital"
-                    print("DEBUG UI: Toggled capital placement ON")
                 return "capital_mode"
-            else:
-                print("DEBUG UI: Cannot afford capital")
 
         # Check seer button - immediate spawn
         if self.seer_button_rect.collidepoint(pos):